@@ -1,32 +1,55 @@
 """Gemini-powered document analysis module for GuidWire Builder."""
 
-import json
+import hashlib
+import os
 import re
+import tempfile
+from pathlib import Path
 from typing import Any
 
+import orjson
 
-_PROMPT_TEMPLATE = (
-    "You are an expert IT support documentation analyst. Analyze the following "
-    "support documentation and extract ALL troubleshooting workflows it contains.\n\n"
-    "Return ONLY a valid JSON object with no markdown, no explanation, and no "
-    "code blocks. The JSON must follow this exact schema:\n\n"
-    "{{\n"
+
+_MODEL_ID = "gemini-2.5-flash"
+
+# Bump whenever _PROMPT_PREFIX changes so previously cached responses are
+# no longer served for the new prompt.
+_PROMPT_VERSION = "v1"
+
+_DEFAULT_CACHE_DIR = Path.home() / ".guidwire" / "llm_cache"
+
+# Documents estimated (at ``len(text) // 4``) above _MAX_DOC_TOKENS are split
+# into segments of at most _SEGMENT_TOKENS, which keeps each request in the
+# range where latency grows roughly linearly with prompt size.
+_MAX_DOC_TOKENS = 12_000
+_SEGMENT_TOKENS = 8_000
+_MAX_SEGMENT_WORKERS = 4
+
+# Markdown code fences Gemini sometimes wraps its JSON in
+_FENCE_OPEN = re.compile(r"^```[a-zA-Z]*\n?", re.IGNORECASE)
+_FENCE_CLOSE = re.compile(r"\n?```$", re.IGNORECASE)
+
+# Shared schema and rules for single and batched prompts.  Prompts are built
+# by plain concatenation, so the text before the document is one fixed
+# prefix (no per-call ``str.format`` parsing).
+_SCHEMA_AND_RULES = (
+    "{\n"
     '  "title": "string — the main issue or topic this document addresses",\n'
     '  "description": "string — one sentence summary of what this tree helps resolve",\n'
     '  "nodes": [\n'
-    "    {{\n"
+    "    {\n"
     '      "id": "string — unique node id, start with start for the first node",\n'
     '      "type": "string — either question, step, or resolution",\n'
     '      "text": "string — the question asked, instruction given, or resolution message",\n'
     '      "options": [\n'
-    "        {{\n"
+    "        {\n"
     '          "label": "string — the option label shown to the user",\n'
     '          "next": "string — the id of the next node this option leads to"\n'
-    "        }}\n"
+    "        }\n"
     "      ]\n"
-    "    }}\n"
+    "    }\n"
     "  ]\n"
-    "}}\n\n"
+    "}\n\n"
     "Rules:\n"
     "- type question nodes must have an options array with at least 2 options\n"
     "- type step nodes have a single next field (string) pointing to the next node id, "
@@ -36,30 +59,74 @@ _PROMPT_TEMPLATE = (
     "- The first node id must always be start\n"
     "- Extract every branch, every condition, and every resolution the document describes\n"
     "- Do not summarize or collapse steps — preserve full granularity\n\n"
-    "Document to analyze:\n"
-    "{document_text}"
 )
 
+_PROMPT_PREFIX = (
+    "You are an expert IT support documentation analyst. Analyze the following "
+    "support documentation and extract ALL troubleshooting workflows it contains.\n\n"
+    "Return ONLY a valid JSON object with no markdown, no explanation, and no "
+    "code blocks. The JSON must follow this exact schema:\n\n"
+    + _SCHEMA_AND_RULES
+    + "Document to analyze:\n"
+)
+
+# Only the short header varies (document count); it is formatted per call.
+_BATCH_PROMPT_HEADER = (
+    "You are an expert IT support documentation analyst. Analyze each of the "
+    "following {count} support documents independently and extract ALL "
+    "troubleshooting workflows each one contains.\n\n"
+    "Return ONLY a valid JSON array with no markdown, no explanation, and no "
+    "code blocks. The array must contain exactly {count} objects — one per "
+    "document, in the order the documents are given. Each object must follow "
+    "this exact schema:\n\n"
+)
+_BATCH_PROMPT_BODY = _SCHEMA_AND_RULES + "Documents to analyze:\n"
+
 
 class DocumentAnalyzer:
     """Sends extracted document text to Gemini and parses the structured response."""
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        cache_dir: str | Path | None = _DEFAULT_CACHE_DIR,
+        segment_workers: int = _MAX_SEGMENT_WORKERS,
+    ) -> None:
         """Initialize the analyzer with a Google Gemini API key.
 
         Args:
             api_key: A valid Google Gemini API key.
+            cache_dir: Directory for cached Gemini responses, keyed by a hash
+                       of the model, prompt version and document text.  Pass
+                       *None* to disable the cache.
+            segment_workers: Maximum concurrent requests for the segments of
+                       one oversize document.  Callers that already analyze
+                       documents in parallel pass 1 so segments run
+                       sequentially within their own worker.
         """
         import google.generativeai as genai
 
         genai.configure(api_key=api_key)
-        self._model = genai.GenerativeModel("gemini-2.5-flash")
+        # JSON mode makes Gemini emit bare JSON, so replies need no fence
+        # stripping or prose trimming and fail to parse far less often.
+        self._model = genai.GenerativeModel(
+            _MODEL_ID,
+            generation_config={"response_mime_type": "application/json"},
+        )
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._segment_workers = max(1, segment_workers)
 
-    def analyze(self, raw_text: str) -> dict[str, Any]:
+    def analyze(self, raw_text: str, cache: bool = True) -> dict[str, Any]:
         """Send document text to Gemini and return a parsed tree dict.
 
+        Identical document text is served from the on-disk response cache
+        instead of calling Gemini again.  Documents too long for one request
+        are split on paragraph boundaries, the segments analyzed
+        concurrently, and the partial trees merged under a root question.
+
         Args:
             raw_text: The plain-text content of the ingested document.
+            cache: Set to *False* to bypass the response cache for this call.
 
         Returns:
             A Python dict following the GuidWire tree schema.
@@ -69,19 +136,224 @@ class DocumentAnalyzer:
             google.api_core.exceptions.GoogleAPIError: For network or API-level
                 errors (propagated).
         """
-        prompt = _PROMPT_TEMPLATE.format(document_text=raw_text)
+        cache_path = self._cache_path(raw_text) if cache else None
+        cached = self._read_cache(cache_path)
+        if cached is not None:
+            return cached
+
+        if len(raw_text) // 4 > _MAX_DOC_TOKENS:
+            tree_dict = self._analyze_segments(_split_segments(raw_text), cache)
+        else:
+            prompt = _PROMPT_PREFIX + raw_text
+            tree_dict = self._generate(prompt)
+
+        if cache_path is not None:
+            self._write_cache(cache_path, tree_dict)
+        return tree_dict
+
+    def analyze_batch(
+        self, raw_texts: list[str], cache: bool = True
+    ) -> list[dict[str, Any]]:
+        """Analyze several short documents with a single Gemini request.
+
+        Batching amortizes the per-request round trip and prompt overhead
+        across documents.  Cached documents are not re-sent.
+
+        Args:
+            raw_texts: Plain-text content of each document.
+            cache: Set to *False* to bypass the response cache for this call.
+
+        Returns:
+            One tree dict per input text, in the same order.
+
+        Raises:
+            ValueError: If Gemini's response is not a JSON array holding one
+                        object per document.
+            google.api_core.exceptions.GoogleAPIError: For network or API-level
+                errors (propagated).
+        """
+        results: list[dict[str, Any] | None] = [None] * len(raw_texts)
+        pending: list[int] = []
+        for idx, text in enumerate(raw_texts):
+            cached = self._read_cache(self._cache_path(text) if cache else None)
+            if cached is None:
+                pending.append(idx)
+            else:
+                results[idx] = cached
+
+        if pending:
+            documents = "\n\n".join(
+                f"--- DOCUMENT {n} ---\n{raw_texts[idx]}"
+                for n, idx in enumerate(pending, start=1)
+            )
+            prompt = (
+                _BATCH_PROMPT_HEADER.format(count=len(pending))
+                + _BATCH_PROMPT_BODY
+                + documents
+            )
+            trees = self._generate(prompt)
+
+            if (
+                not isinstance(trees, list)
+                or len(trees) != len(pending)
+                or not all(isinstance(t, dict) for t in trees)
+            ):
+                raise ValueError(
+                    f"Gemini did not return a JSON array of {len(pending)} tree objects"
+                )
 
+            for idx, tree_dict in zip(pending, trees):
+                results[idx] = tree_dict
+                cache_path = self._cache_path(raw_texts[idx]) if cache else None
+                if cache_path is not None:
+                    self._write_cache(cache_path, tree_dict)
+
+        return results  # type: ignore[return-value]
+
+    def discard_cached(self, raw_text: str) -> None:
+        """Remove the cached response for *raw_text*, if any.
+
+        Callers use this when a cached tree fails validation so the next
+        :meth:`analyze` call asks Gemini again.
+        """
+        texts = [raw_text]
+        if len(raw_text) // 4 > _MAX_DOC_TOKENS:
+            texts.extend(_split_segments(raw_text))
+        for text in texts:
+            cache_path = self._cache_path(text)
+            if cache_path is not None:
+                cache_path.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _analyze_segments(self, segments: list[str], cache: bool) -> dict[str, Any]:
+        """Analyze each segment of an oversize document and merge the trees."""
+        workers = min(len(segments), self._segment_workers)
+        if workers <= 1:
+            return _merge_trees([self.analyze(seg, cache=cache) for seg in segments])
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            trees = list(executor.map(lambda seg: self.analyze(seg, cache=cache), segments))
+        return _merge_trees(trees)
+
+    def _generate(self, prompt: str) -> Any:
+        """Send *prompt* to Gemini and return the parsed JSON response.
+
+        Raises:
+            ValueError: If the response cannot be parsed as valid JSON.
+        """
         response = self._model.generate_content(prompt)
         raw_response = response.text.strip()
 
         # Strip markdown code fences if Gemini included them despite instructions
-        raw_response = re.sub(r"^```[a-zA-Z]*\n?", "", raw_response, flags=re.IGNORECASE)
-        raw_response = re.sub(r"\n?```$", "", raw_response, flags=re.IGNORECASE).strip()
+        if raw_response.startswith("```"):
+            raw_response = _FENCE_CLOSE.sub("", _FENCE_OPEN.sub("", raw_response)).strip()
 
         try:
-            return json.loads(raw_response)
-        except json.JSONDecodeError as exc:
+            return orjson.loads(raw_response)
+        except orjson.JSONDecodeError as exc:
             raise ValueError(
                 f"Gemini returned a response that could not be parsed as JSON: {exc}\n"
                 f"Raw response (first 500 chars):\n{raw_response[:500]}"
             ) from exc
+
+    def _cache_path(self, raw_text: str) -> Path | None:
+        if self._cache_dir is None:
+            return None
+        key = hashlib.sha256(
+            f"{_MODEL_ID}\0{_PROMPT_VERSION}\0{raw_text}".encode("utf-8")
+        ).hexdigest()
+        return self._cache_dir / f"{key}.json"
+
+    @staticmethod
+    def _read_cache(cache_path: Path | None) -> dict[str, Any] | None:
+        """Return the cached tree at *cache_path*, or *None* on a miss."""
+        if cache_path is None or not cache_path.exists():
+            return None
+        try:
+            return orjson.loads(cache_path.read_bytes())
+        except (orjson.JSONDecodeError, OSError):
+            return None  # Corrupt or unreadable entry — treat as a miss
+
+    @staticmethod
+    def _write_cache(cache_path: Path, tree_dict: dict[str, Any]) -> None:
+        """Atomically write *tree_dict* to *cache_path*; failures are ignored."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=cache_path.parent, suffix=".tmp", delete=False
+            ) as tmp:
+                tmp.write(orjson.dumps(tree_dict))
+            os.replace(tmp.name, cache_path)
+        except OSError:
+            pass  # The cache is an optimization only
+
+
+# ---------------------------------------------------------------------------
+# Oversize document helpers
+# ---------------------------------------------------------------------------
+
+
+def _split_segments(text: str) -> list[str]:
+    """Split *text* on blank lines into segments of at most _SEGMENT_TOKENS.
+
+    Paragraphs longer than a whole segment are cut at the size limit.
+    """
+    limit = _SEGMENT_TOKENS * 4
+    segments: list[str] = []
+    current: list[str] = []
+    size = 0
+    for para in text.split("\n\n"):
+        for piece in [para[i:i + limit] for i in range(0, len(para), limit)] or [""]:
+            if current and size + len(piece) > limit:
+                segments.append("\n\n".join(current))
+                current, size = [], 0
+            current.append(piece)
+            size += len(piece) + 2
+    if current:
+        segments.append("\n\n".join(current))
+    return segments
+
+
+def _merge_trees(trees: list[dict[str, Any]]) -> dict[str, Any]:
+    """Combine per-segment trees into one tree.
+
+    Node ids are prefixed per segment (``part1_start`` …) and a new
+    ``start`` question offers each segment's tree by its title.
+    """
+    nodes: list[dict[str, Any]] = []
+    options: list[dict[str, str]] = []
+    for n, tree in enumerate(trees, start=1):
+        prefix = f"part{n}_"
+        for node in tree.get("nodes", []):
+            node = dict(node)
+            if "id" in node:
+                node["id"] = prefix + str(node["id"])
+            if node.get("next"):
+                node["next"] = prefix + str(node["next"])
+            if isinstance(node.get("options"), list):
+                # Options without "next" are left for validation to reject
+                node["options"] = [
+                    {**opt, "next": prefix + str(opt["next"])}
+                    if isinstance(opt, dict) and "next" in opt else opt
+                    for opt in node["options"]
+                ]
+            nodes.append(node)
+        options.append({"label": tree.get("title") or f"Part {n}", "next": f"{prefix}start"})
+
+    first = trees[0] if trees else {}
+    root = {
+        "id": "start",
+        "type": "question",
+        "text": "Which of these issues are you troubleshooting?",
+        "options": options,
+    }
+    return {
+        "title": first.get("title", "Untitled"),
+        "description": first.get("description", ""),
+        "nodes": [root, *nodes],
+    }
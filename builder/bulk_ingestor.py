@@ -7,11 +7,23 @@ re-processing on subsequent runs.
 
 from __future__ import annotations
 
+import errno
 import hashlib
-import json
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
+
+import orjson
+
+# Hashing, copying and text extraction are dominated by file I/O and C-level
+# parsing, so a thread per file in flight overlaps them well.
+_DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+# Lower-cased file suffixes picked up by scan(); matched with a single
+# str.endswith(tuple) per directory entry during one tree walk.
+_SCAN_SUFFIXES: tuple[str, ...] = (".docx",)
 
 
 class BulkIngestor:
@@ -34,17 +46,21 @@ class BulkIngestor:
               - ``path``     – absolute Path to the source file
               - ``rel_path`` – Path relative to *root*
               - ``size``     – file size in bytes
+              - ``mtime_ns`` – modification time in nanoseconds
         """
         results: list[dict[str, Any]] = []
-        for p in sorted(root.rglob("*.docx")):
-            if p.is_file():
-                results.append(
-                    {
-                        "path": p,
-                        "rel_path": p.relative_to(root),
-                        "size": p.stat().st_size,
-                    }
-                )
+        for entry in self._walk_files(root):
+            p = Path(entry.path)
+            st = entry.stat()
+            results.append(
+                {
+                    "path": p,
+                    "rel_path": p.relative_to(root),
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                }
+            )
+        results.sort(key=lambda r: r["rel_path"])
         return results
 
     def ingest(
@@ -53,106 +69,313 @@ class BulkIngestor:
         output_base: Path,
         manifest_path: Path,
         progress_callback: Callable[[str, int, int], None] | None = None,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
     ) -> dict[str, Any]:
         """Copy DOCX files preserving folder structure, extract text, and
         update the manifest (hash-based incremental).
 
+        Files are processed concurrently on up to *max_workers* threads;
+        the manifest and progress callback are only touched from the
+        calling thread.
+
         Args:
             root: Source root folder selected by the user.
             output_base: Base output folder (e.g. ``ForgedFiber37_Content``).
-                         DOCX files are placed under ``output_base/docs/``.
+                         DOCX files are placed under ``output_base/docs/``
+                         and their extracted text under ``output_base/text/``.
             manifest_path: Path to the manifest JSON file.  Loaded if it
                            exists; created/updated after processing.
             progress_callback: Optional ``callback(message, current, total)``.
+            max_workers: Maximum number of files processed at once.
 
         Returns:
             The full manifest dictionary keyed by relative path string.
         """
-        docs_dir = output_base / "docs"
-        docs_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self._load_manifest(manifest_path)
+        for _ in self._iter_records(
+            root, output_base, manifest_path, manifest, progress_callback, max_workers
+        ):
+            pass
+        return manifest
 
-        # Load existing manifest for incremental processing
+    def iter_ingest(
+        self,
+        root: Path,
+        output_base: Path,
+        manifest_path: Path,
+        progress_callback: Callable[[str, int, int], None] | None = None,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Like :meth:`ingest`, but yield ``(rel_str, record)`` for each file
+        as soon as it has been processed.
+
+        This lets :meth:`LibraryBuilder.build_streaming` start analyzing
+        early documents while later ones are still being extracted.  The
+        manifest is written once the generator is exhausted.
+        """
+        manifest = self._load_manifest(manifest_path)
+        yield from self._iter_records(
+            root, output_base, manifest_path, manifest, progress_callback, max_workers
+        )
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _journal_path(manifest_path: Path) -> Path:
+        """Return the append-only journal kept next to *manifest_path*."""
+        return manifest_path.with_suffix(".jsonl")
+
+    def _load_manifest(self, manifest_path: Path) -> dict[str, Any]:
+        """Load an existing manifest for incremental processing.
+
+        Records journaled by an interrupted run are replayed on top (last
+        write wins), so work done before a crash is not repeated.
+        """
         manifest: dict[str, Any] = {}
         if manifest_path.exists():
             try:
-                with manifest_path.open(encoding="utf-8") as fh:
-                    manifest = json.load(fh)
-            except (json.JSONDecodeError, OSError):
+                manifest = orjson.loads(manifest_path.read_bytes())
+            except (orjson.JSONDecodeError, OSError):
                 manifest = {}
 
+        journal_path = self._journal_path(manifest_path)
+        if journal_path.exists():
+            try:
+                lines = journal_path.read_bytes().splitlines()
+            except OSError:
+                lines = []
+            for line in lines:
+                try:
+                    item = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue  # Torn final line from a crash mid-append
+                manifest[item["path"]] = item["record"]
+        return manifest
+
+    def _iter_records(
+        self,
+        root: Path,
+        output_base: Path,
+        manifest_path: Path,
+        manifest: dict[str, Any],
+        progress_callback: Callable[[str, int, int], None] | None,
+        max_workers: int,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Process every file under *root*, yielding records in completion
+        order, then update *manifest* in place and persist it.
+
+        Each new or changed record is appended to the journal as soon as it
+        is produced; the journal is compacted into *manifest_path* at the end.
+        """
+        docs_dir = output_base / "docs"
+        docs_dir.mkdir(parents=True, exist_ok=True)
+
         files = self.scan(root)
         total = len(files)
 
         from builder.ingestor import DocumentIngestor  # local import to avoid circular deps
 
+        # DocumentIngestor is stateless, so one instance is shared by all workers
         ingestor = DocumentIngestor()
+        records: list[dict[str, Any]] = [{} for _ in range(total)]
 
-        for idx, entry in enumerate(files, start=1):
-            src_path: Path = entry["path"]
-            rel_path: Path = entry["rel_path"]
-            rel_str = str(rel_path)
-            dest_path = docs_dir / rel_path
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
+        journal_path = self._journal_path(manifest_path)
+        journal_path.parent.mkdir(parents=True, exist_ok=True)
 
-            file_hash = self._hash_file(src_path)
+        # Fast path: a file whose size and mtime (from the scan's stat)
+        # match its manifest record was not touched — reuse the record
+        # without opening the file or handing it to the pool.
+        pending: list[int] = []
+        current = 0
+        for idx, entry in enumerate(files):
+            known = manifest.get(str(entry["rel_path"]))
+            if (
+                known
+                and known.get("size") == entry["size"]
+                and known.get("mtime_ns") == entry["mtime_ns"]
+            ):
+                records[idx] = known
+                current += 1
+                if progress_callback:
+                    progress_callback(
+                        f"Skipping (unchanged): {entry['rel_path']}", current, total
+                    )
+                yield str(entry["rel_path"]), known
+            else:
+                pending.append(idx)
+
+        with (
+            journal_path.open("ab", buffering=0) as journal,
+            ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor,
+        ):
+            futures = {
+                executor.submit(
+                    self._ingest_one,
+                    files[idx],
+                    output_base,
+                    manifest.get(str(files[idx]["rel_path"]), {}),
+                    ingestor,
+                ): idx
+                for idx in pending
+            }
+
+            for current, future in enumerate(as_completed(futures), start=current + 1):
+                idx = futures[future]
+                rel_path: Path = files[idx]["rel_path"]
+                record, changed = future.result()
+                records[idx] = record
+
+                if record != manifest.get(str(rel_path)):
+                    journal.write(
+                        orjson.dumps({"path": str(rel_path), "record": record}) + b"\n"
+                    )
 
-            # Skip unchanged files
-            if manifest.get(rel_str, {}).get("hash") == file_hash:
                 if progress_callback:
-                    progress_callback(f"Skipping (unchanged): {rel_path}", idx, total)
-                continue
+                    if not changed:
+                        progress_callback(f"Skipping (unchanged): {rel_path}", current, total)
+                    else:
+                        progress_callback(f"Indexed: {rel_path}", current, total)
 
-            if progress_callback:
-                progress_callback(f"Copying: {rel_path}", idx, total)
+                try:
+                    yield str(rel_path), record
+                except GeneratorExit:
+                    # Consumer stopped early; don't process the remaining files
+                    executor.shutdown(cancel_futures=True)
+                    raise
 
-            shutil.copy2(str(src_path), str(dest_path))
+        # Apply in scan order so the manifest layout is deterministic
+        for entry, record in zip(files, records):
+            manifest[str(entry["rel_path"])] = record
 
-            # Extract text; capture errors without aborting the whole run
-            text = ""
-            extract_error = ""
-            try:
-                text = ingestor.ingest(src_path)
-            except (FileNotFoundError, PermissionError) as exc:
-                extract_error = f"File access error: {exc}"
-            except ValueError as exc:
-                extract_error = f"Unsupported format: {exc}"
-            except Exception as exc:  # noqa: BLE001 — e.g. corrupt DOCX
-                extract_error = f"Extraction error: {exc}"
-
-            # Derive category from the top-level sub-folder name
-            parts = rel_path.parts
-            category = str(parts[0]) if len(parts) > 1 else "Uncategorized"
-
-            manifest[rel_str] = {
-                "hash": file_hash,
-                "dest": str(dest_path),
-                "category": category,
-                "text": text,
-                "size": src_path.stat().st_size,
-                **({"extract_error": extract_error} if extract_error else {}),
-            }
+        # Compact the journal into the manifest (atomically), then drop it
+        tmp_path = manifest_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, manifest_path)
+        journal_path.unlink(missing_ok=True)
+
+    def _ingest_one(
+        self,
+        entry: dict[str, Any],
+        output_base: Path,
+        known: dict[str, Any],
+        ingestor: Any,
+    ) -> tuple[dict[str, Any], bool]:
+        """Hash, copy and extract one scanned file on a worker thread.
 
-            if progress_callback:
-                progress_callback(f"Indexed: {rel_path}", idx, total)
+        Called only for files whose size/mtime differ from their *known*
+        manifest record (see _iter_records); the file is hashed and only
+        re-processed if the SHA-256 differs.
 
-        # Persist manifest
-        manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        manifest_path.write_text(
-            json.dumps(manifest, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        Returns:
+            ``(record, changed)`` — the manifest record to store and whether
+            the file was copied and re-extracted.
+        """
+        src_path: Path = entry["path"]
+        rel_path: Path = entry["rel_path"]
+        fingerprint = {"size": entry["size"], "mtime_ns": entry["mtime_ns"]}
 
-        return manifest
+        file_hash = self._hash_file(src_path)
 
-    # ------------------------------------------------------------------
-    # Private helpers
-    # ------------------------------------------------------------------
+        # Skip unchanged files, refreshing the fingerprint for the next run
+        if known.get("hash") == file_hash:
+            return {**known, **fingerprint}, False
+
+        dest_path = output_base / "docs" / rel_path
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        self._copy_file(src_path, dest_path)
+
+        # Extract text; capture errors without aborting the whole run
+        text = ""
+        extract_error = ""
+        try:
+            text = ingestor.ingest(src_path)
+        except (FileNotFoundError, PermissionError) as exc:
+            extract_error = f"File access error: {exc}"
+        except ValueError as exc:
+            extract_error = f"Unsupported format: {exc}"
+        except Exception as exc:  # noqa: BLE001 — e.g. corrupt DOCX
+            extract_error = f"Extraction error: {exc}"
+
+        # Keep the text out of the manifest so it stays small; documents
+        # with no text get no text file and are skipped by LibraryBuilder.
+        text_file = ""
+        if text.strip():
+            rel_text = Path("text") / rel_path.with_name(rel_path.name + ".txt")
+            text_path = output_base / rel_text
+            text_path.parent.mkdir(parents=True, exist_ok=True)
+            text_path.write_text(text, encoding="utf-8")
+            text_file = rel_text.as_posix()
+
+        # Derive category from the top-level sub-folder name
+        parts = rel_path.parts
+        category = str(parts[0]) if len(parts) > 1 else "Uncategorized"
+
+        record = {
+            "hash": file_hash,
+            "dest": str(dest_path),
+            "category": category,
+            **({"text_file": text_file} if text_file else {}),
+            **fingerprint,
+            **({"extract_error": extract_error} if extract_error else {}),
+        }
+        return record, True
+
+    @staticmethod
+    def _walk_files(root: Path) -> Iterator[os.DirEntry[str]]:
+        """Yield entries for files under *root* whose name ends in _SCAN_SUFFIXES.
+
+        One ``os.scandir`` pass over the tree.  Like ``Path.rglob``, symlinked
+        directories are not descended into and unreadable ones are skipped.
+        """
+        stack = [str(root)]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(_SCAN_SUFFIXES) and entry.is_file():
+                        yield entry
+
+    @staticmethod
+    def _copy_file(src: Path, dest: Path) -> None:
+        """Copy *src* to *dest* with metadata, keeping the data in the kernel.
+
+        Uses ``os.copy_file_range`` where available (Linux 5.3+), which also
+        lets reflink-capable filesystems (btrfs, XFS) share extents instead
+        of copying.  Falls back to ``shutil.copyfile`` on other platforms or
+        when the kernel refuses (e.g. cross-filesystem on older kernels).
+        """
+        copied = False
+        if hasattr(os, "copy_file_range"):
+            try:
+                with src.open("rb") as fsrc, dest.open("wb") as fdst:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if n == 0:
+                            break
+                        remaining -= n
+                copied = remaining == 0
+            except OSError as exc:
+                if exc.errno not in (errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL):
+                    raise
+
+        if not copied:
+            shutil.copyfile(src, dest)
+        shutil.copystat(src, dest)
 
     @staticmethod
     def _hash_file(path: Path) -> str:
-        """Return the SHA-256 hex digest of a file."""
-        h = hashlib.sha256()
+        """Return the SHA-256 hex digest of a file.
+
+        ``hashlib.file_digest`` reads the file in C without per-chunk Python
+        overhead.
+        """
         with path.open("rb") as fh:
-            for chunk in iter(lambda: fh.read(65_536), b""):
-                h.update(chunk)
-        return h.hexdigest()
+            return hashlib.file_digest(fh, "sha256").hexdigest()
@@ -2,6 +2,15 @@
 
 from pathlib import Path
 
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+# Clark-notation tags compared per element in _read_docx
+_W_BODY = f"{_W_NS}body"
+_W_P = f"{_W_NS}p"
+_W_R = f"{_W_NS}r"
+_W_T = f"{_W_NS}t"
+_W_TAB = f"{_W_NS}tab"
+_W_TEXT_TAGS = (_W_T, _W_TAB, f"{_W_NS}br", f"{_W_NS}cr")
+
 
 class DocumentIngestor:
     """Reads and extracts plain text from supported document formats."""
@@ -47,13 +56,63 @@ class DocumentIngestor:
         return path.read_text(encoding="utf-8", errors="replace")
 
     def _read_docx(self, path: Path) -> str:
-        import docx  # python-docx
-
-        document = docx.Document(str(path))
-        paragraphs = [para.text for para in document.paragraphs]
+        import zipfile
+
+        from lxml import etree
+
+        # Stream <w:p> elements straight out of word/document.xml rather than
+        # building python-docx's object model.  Only top-level body
+        # paragraphs are read, matching document.paragraphs, which skips
+        # tables; dropping each one and its preceding siblings once read
+        # keeps memory flat regardless of document size.
+        paragraphs: list[str] = []
+        with zipfile.ZipFile(str(path)) as archive, archive.open("word/document.xml") as fh:
+            for _, para in etree.iterparse(fh, tag=_W_P):
+                body = para.getparent()
+                if body.tag != _W_BODY:
+                    continue
+                parts: list[str] = []
+                for el in para.iter(*_W_TEXT_TAGS):
+                    tag = el.tag
+                    if tag == _W_T:
+                        parts.append(el.text or "")
+                    elif tag == _W_TAB:
+                        # <w:tab> under <w:tabs> is a tab-stop definition
+                        if el.getparent().tag == _W_R:
+                            parts.append("\t")
+                    else:
+                        parts.append("\n")
+                paragraphs.append("".join(parts))
+                para.clear()
+                while para.getprevious() is not None:
+                    del body[0]
         return "\n".join(paragraphs)
 
     def _read_pdf(self, path: Path) -> str:
+        try:
+            import pypdfium2 as pdfium
+        except ImportError:
+            # PDFium wheels are unavailable on some platforms
+            return self._read_pdf_pdfplumber(path)
+
+        pages: list[str] = []
+        pdf = pdfium.PdfDocument(str(path))
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                try:
+                    text = textpage.get_text_range()
+                finally:
+                    textpage.close()
+                    page.close()
+                if text:
+                    # PDFium terminates lines with CRLF regardless of platform
+                    pages.append(text.replace("\r\n", "\n"))
+        finally:
+            pdf.close()
+        return "\n".join(pages)
+
+    def _read_pdf_pdfplumber(self, path: Path) -> str:
         import pdfplumber
 
         pages: list[str] = []
@@ -65,6 +124,24 @@ class DocumentIngestor:
         return "\n".join(pages)
 
     def _read_html(self, path: Path) -> str:
+        try:
+            from selectolax.parser import HTMLParser
+        except ImportError:
+            return self._read_html_bs4(path)
+
+        tree = HTMLParser(path.read_bytes())
+
+        # Remove script and style elements (strip_tags is safe for nested
+        # matches such as <meta> inside an already-removed <head>)
+        tree.strip_tags(["script", "style", "head", "meta", "link"])
+
+        root = tree.body if tree.body is not None else tree.root
+        if root is None:
+            return ""
+        text = root.text(separator="\n", strip=True)
+        return "\n".join(line for line in text.split("\n") if line)
+
+    def _read_html_bs4(self, path: Path) -> str:
         from bs4 import BeautifulSoup
 
         html = path.read_text(encoding="utf-8", errors="replace")
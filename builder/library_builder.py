@@ -7,10 +7,21 @@ catalog that the offline viewer can browse and search.
 
 from __future__ import annotations
 
-import json
 import re
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Iterator
+
+import orjson
+
+# Gemini calls are network-bound and independent per document, so several
+# are kept in flight at once.  Keep this modest to stay under API rate limits.
+_DEFAULT_MAX_WORKERS = 8
+
+# Short documents are sent to Gemini several at a time to amortize the
+# per-request overhead.  Token counts are estimated as ``len(text) // 4``.
+_MAX_BATCH_TOKENS = 6_000
+_MAX_BATCH_DOCS = 8
 
 
 class LibraryBuilder:
@@ -22,71 +33,136 @@ class LibraryBuilder:
         output_base: Path,
         api_key: str,
         progress_callback: Callable[[str, int, int], None] | None = None,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
     ) -> Path:
         """Generate decision trees for every document in *manifest* and write
         ``library.json``.
 
+        Documents are analyzed concurrently (up to *max_workers* Gemini
+        requests in flight); validation, saving and progress reporting all
+        happen on the calling thread as each analysis completes.
+
         Args:
             manifest: The manifest dict produced by :class:`BulkIngestor`.
             output_base: Base content folder (``*_Content``).  Trees are
                          written to ``output_base/trees/``.
             api_key: Google Gemini API key passed to :class:`DocumentAnalyzer`.
             progress_callback: Optional ``callback(message, current, total)``.
+            max_workers: Maximum number of concurrent Gemini requests.
 
         Returns:
             Path to the generated ``library.json``.
         """
+        # Group entries by category for ordered processing
+        categories: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+        for rel_str, entry in manifest.items():
+            cat = entry.get("category", "Uncategorized")
+            categories.setdefault(cat, []).append((rel_str, entry))
+
+        docs = [
+            (rel_str, entry)
+            for category in sorted(categories.keys())
+            for rel_str, entry in categories[category]
+        ]
+        return self.build_streaming(
+            docs, output_base, api_key, progress_callback, max_workers, total=len(docs)
+        )
+
+    def build_streaming(
+        self,
+        docs: Iterable[tuple[str, dict[str, Any]]],
+        output_base: Path,
+        api_key: str,
+        progress_callback: Callable[[str, int, int], None] | None = None,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+        total: int | None = None,
+    ) -> Path:
+        """Like :meth:`build`, but analyze ``(rel_str, entry)`` pairs as
+        *docs* produces them.
+
+        Passing :meth:`BulkIngestor.iter_ingest` as *docs* overlaps text
+        extraction of later files with Gemini requests for earlier ones.
+        ``library.json`` is written once *docs* is exhausted and every
+        analysis has finished, with entries grouped by category.
+
+        Args:
+            total: Number of documents, if known up front; otherwise progress
+                   is reported against the number received so far.
+        """
         from builder.analyzer import DocumentAnalyzer
         from builder.tree_builder import TreeBuilder
 
         trees_dir = output_base / "trees"
         trees_dir.mkdir(parents=True, exist_ok=True)
 
-        analyzer = DocumentAnalyzer(api_key)
+        # Documents already run max_workers at a time; segments of an
+        # oversize document stay sequential so requests never exceed that.
+        analyzer = DocumentAnalyzer(api_key, segment_workers=1)
         validator = TreeBuilder()
 
-        # Group entries by category for ordered processing
-        categories: dict[str, list[tuple[str, dict[str, Any]]]] = {}
-        for rel_str, entry in manifest.items():
-            cat = entry.get("category", "Uncategorized")
-            categories.setdefault(cat, []).append((rel_str, entry))
-
-        total = sum(len(v) for v in categories.values())
+        jobs: list[tuple[str, str, dict[str, Any]]] = []
+        results: dict[int, dict[str, Any]] = {}
+        futures: dict[Future, list[int]] = {}
         current = 0
-        library_entries: list[dict[str, Any]] = []
 
-        for category in sorted(categories.keys()):
-            for rel_str, entry in categories[category]:
-                current += 1
-                text: str = entry.get("text", "")
-                if not text.strip():
-                    if progress_callback:
-                        progress_callback(
-                            f"[{category}] Skipping (no text): {rel_str}",
-                            current,
-                            total,
-                        )
-                    continue
+        def _report(msg: str) -> None:
+            if progress_callback:
+                progress_callback(msg, current, total if total is not None else len(jobs))
 
-                if progress_callback:
-                    progress_callback(
-                        f"[{category}] Analyzing: {rel_str}", current, total
-                    )
+        def _pending() -> Iterator[tuple[int, int]]:
+            # Text is only read from disk inside the workers, so just one
+            # batch per worker is held in memory at a time.
+            nonlocal current
+            for rel_str, entry in docs:
+                idx = len(jobs)
+                category = entry.get("category", "Uncategorized")
+                jobs.append((category, rel_str, entry))
+                size = _text_size(entry, output_base)
+                if size:
+                    yield idx, size
+                else:
+                    current += 1
+                    _report(f"[{category}] Skipping (no text): {rel_str}")
+
+        def _run_group(group: list[int]) -> list[tuple[str | None, Any]]:
+            # Pair each outcome with the text it came from (None when the
+            # text could not be read), so one unreadable file only fails
+            # its own document.
+            loaded: list[str | Exception] = []
+            for idx in group:
+                try:
+                    loaded.append(_load_text(jobs[idx][2], output_base))
+                except (OSError, UnicodeDecodeError) as exc:
+                    loaded.append(exc)
+            texts = [text for text in loaded if isinstance(text, str)]
+            analyzed = iter(_analyze_group(analyzer, texts) if texts else ())
+            return [
+                (text, next(analyzed)) if isinstance(text, str) else (None, text)
+                for text in loaded
+            ]
 
+        def _handle(future: Future) -> None:
+            nonlocal current
+            for idx, (text, outcome) in zip(futures.pop(future), future.result()):
+                category, rel_str, _ = jobs[idx]
+                current += 1
+                _report(f"[{category}] Analyzed: {rel_str}")
+
+                if text is None:
+                    _report(f"  ✗ Analysis error ({outcome})")
+                    continue
                 try:
-                    tree_dict = analyzer.analyze(text)
+                    if isinstance(outcome, Exception):
+                        raise outcome
+                    tree_dict = outcome
                     validator.validate(tree_dict)
                 except ValueError as exc:
-                    if progress_callback:
-                        progress_callback(
-                            f"  ✗ Validation error ({exc})", current, total
-                        )
+                    # Don't keep serving an invalid tree from the response cache
+                    analyzer.discard_cached(text)
+                    _report(f"  ✗ Validation error ({exc})")
                     continue
                 except Exception as exc:  # noqa: BLE001 — API/network errors
-                    if progress_callback:
-                        progress_callback(
-                            f"  ✗ Analysis error ({exc})", current, total
-                        )
+                    _report(f"  ✗ Analysis error ({exc})")
                     continue
 
                 # Build a filesystem-safe filename from the relative path
@@ -95,25 +171,115 @@ class LibraryBuilder:
                 tree_path = trees_dir / tree_filename
                 validator.save(tree_dict, tree_path)
 
-                library_entries.append(
-                    {
-                        "title": tree_dict.get("title", rel_str),
-                        "description": tree_dict.get("description", ""),
-                        "category": category,
-                        "tree_file": f"trees/{tree_filename}",
-                        "source_doc": f"docs/{rel_str}",
-                        "symptoms": [],
-                    }
-                )
+                results[idx] = {
+                    "title": tree_dict.get("title", rel_str),
+                    "description": tree_dict.get("description", ""),
+                    "category": category,
+                    "tree_file": f"trees/{tree_filename}",
+                    "source_doc": f"docs/{rel_str}",
+                    "symptoms": [],
+                }
 
-                if progress_callback:
-                    progress_callback(f"  ✓ Tree saved: {tree_filename}", current, total)
+                _report(f"  ✓ Tree saved: {tree_filename}")
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for group in _batch_stream(_pending()):
+                futures[executor.submit(_run_group, group)] = group
+                # Handle finished analyses without blocking the producer
+                for future in [f for f in futures if f.done()]:
+                    _handle(future)
+
+            for future in as_completed(list(futures)):
+                _handle(future)
+
+        # Group by category; within a category keep the order docs arrived in
+        library_entries = [
+            results[idx] for idx in sorted(results, key=lambda i: (jobs[i][0], i))
+        ]
 
         # Write library catalog
         library_path = output_base / "library.json"
-        library_path.write_text(
-            json.dumps({"entries": library_entries}, indent=2, ensure_ascii=False),
-            encoding="utf-8",
+        library_path.write_bytes(
+            orjson.dumps({"entries": library_entries}, option=orjson.OPT_INDENT_2)
         )
 
         return library_path
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+
+def _text_path(entry: dict[str, Any], output_base: Path) -> Path | None:
+    """Return the extracted-text file for a manifest *entry*, if it has one."""
+    text_file = entry.get("text_file")
+    return output_base / text_file if text_file else None
+
+
+def _text_size(entry: dict[str, Any], output_base: Path) -> int:
+    """Return the approximate length of *entry*'s text without reading it.
+
+    Manifests written before text moved out to ``text/`` still carry it
+    inline under ``"text"``.
+    """
+    path = _text_path(entry, output_base)
+    if path is None:
+        return len(entry.get("text", "").strip())
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _load_text(entry: dict[str, Any], output_base: Path) -> str:
+    """Return the extracted text for a manifest *entry*."""
+    path = _text_path(entry, output_base)
+    if path is None:
+        return entry.get("text", "")
+    return path.read_text(encoding="utf-8")
+
+
+def _batch_stream(sizes: Iterable[tuple[int, int]]) -> Iterator[list[int]]:
+    """Group job indices so short documents share a single Gemini request.
+
+    *sizes* yields ``(job index, text length)`` pairs.  Documents are packed
+    in order until a group would exceed ``_MAX_BATCH_TOKENS`` estimated
+    tokens or ``_MAX_BATCH_DOCS`` documents; a document that is large on its
+    own always gets a group to itself.  Each group is yielded as soon as it
+    is full.
+    """
+    group: list[int] = []
+    group_tokens = 0
+    for idx, size in sizes:
+        tokens = size // 4
+        if group and (
+            group_tokens + tokens > _MAX_BATCH_TOKENS or len(group) >= _MAX_BATCH_DOCS
+        ):
+            yield group
+            group, group_tokens = [], 0
+        group.append(idx)
+        group_tokens += tokens
+    if group:
+        yield group
+
+
+def _analyze_group(analyzer: Any, texts: list[str]) -> list[Any]:
+    """Analyze *texts* in one request, falling back to one request each.
+
+    Returns one tree dict or raised exception per text, so a single bad
+    document does not fail the rest of its group.
+    """
+    if len(texts) > 1:
+        try:
+            return list(analyzer.analyze_batch(texts))
+        except Exception:  # noqa: BLE001 — retry the documents individually
+            pass
+
+    outcomes: list[Any] = []
+    for text in texts:
+        try:
+            outcomes.append(analyzer.analyze(text))
+        except Exception as exc:  # noqa: BLE001 — reported per document
+            outcomes.append(exc)
+    return outcomes
@@ -1,131 +1,230 @@
 """Packaging module — compiles the Viewer into a branded standalone .exe."""
 
-import json
+import functools
+import hashlib
 import os
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable
+
+import orjson
+
+# Modules the viewer never imports but that hooks or optional imports (PIL,
+# stdlib) would otherwise pull in and scan.  The viewer needs only tkinter,
+# customtkinter and PIL.Image.
+_EXCLUDED_MODULES = (
+    "numpy",
+    "scipy",
+    "pandas",
+    "matplotlib",
+    "IPython",
+    "PyQt5",
+    "PyQt6",
+    "PySide2",
+    "PySide6",
+    "PIL.ImageQt",
+    "tkinter.test",
+    "pydoc_data",
+    "lib2to3",
+)
+
+# The .spec file for every viewer build, generated in-process instead of
+# having PyInstaller write one from CLI flags and read it back.  UPX is off:
+# it compresses single-threaded and slowly, and the exe size barely matters.
+# optimize=2 compiles -OO bytecode (no docstrings/asserts), shrinking the PKG.
+_SPEC_TEMPLATE = """\
+a = Analysis(
+    [{script!r}],
+    pathex=[{pathex!r}],
+    binaries=[],
+    datas={datas!r},
+    hiddenimports=[],
+    hookspath=[],
+    hooksconfig={{}},
+    runtime_hooks=[],
+    excludes={excludes!r},
+    noarchive=False,
+    optimize=2,
+)
+pyz = PYZ(a.pure)
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.datas,
+    [],
+    name={name!r},
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    runtime_tmpdir=None,
+    console=False,
+    disable_windowed_traceback=False,
+)
+"""
+
+# Options passed on the PyInstaller command line next to the spec file.
+_PYINSTALLER_OPTIONS = ("--log-level=WARN",)
+
+# PyInstaller is killed after this many seconds; only the last lines of its
+# output are kept for the error message.
+_PYINSTALLER_TIMEOUT = 600
+_LOG_TAIL_LINES = 200
+# How often a running PyInstaller is checked for cancellation, in seconds;
+# it logs too little at WARN level to rely on its output for that.
+_CANCEL_POLL_SECONDS = 0.2
+
+# The optional oxipng pass is abandoned after this many seconds and the
+# unoptimized logo PNG is kept.
+_OXIPNG_TIMEOUT = 30
+
+# Finished executables keyed by a hash of everything that goes into them, so
+# rebuilding an unchanged viewer skips PyInstaller entirely.  The least
+# recently used entries are evicted once the cache outgrows its byte budget.
+_EXE_CACHE_DIR = Path.home() / ".guidwire" / "exe_cache"
+_EXE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+_EXE_CACHE_MAX_ENTRIES = 16
+
+# Distributions PyInstaller bundles into the viewer (customtkinter pulls in
+# darkdetect); their versions are part of the cache key.
+_BUNDLED_DISTRIBUTIONS = ("pyinstaller", "customtkinter", "darkdetect", "Pillow", "orjson")
 
 
 class Packager:
     """Produces a branded, standalone GuidWire Viewer executable."""
 
+    def __init__(self) -> None:
+        self._viewer_src: Path | None = None
+
     def build(
         self,
-        tree_json_path: str | Path,
+        tree_json_path: str | Path | None = None,
+        *,
         logo_path: str | Path,
         company_name: str,
         output_dir: str | Path,
         progress_callback: Callable[[str], None] | None = None,
+        cancel_event: threading.Event | None = None,
+        tree_dict: dict[str, Any] | None = None,
     ) -> Path:
         """Build a standalone viewer .exe for the given tree and branding.
 
+        Everything after *tree_json_path* is keyword-only, so a caller passing
+        *tree_dict* can leave *tree_json_path* out.
+
         Args:
-            tree_json_path: Path to the validated tree.json produced by TreeBuilder.
+            tree_json_path: Path to the validated tree.json produced by
+                            TreeBuilder, or *None* when passing *tree_dict*.
             logo_path: Path to the company logo image (any Pillow-supported format).
             company_name: Company name embedded into config.json and the exe name.
             output_dir: Directory where the finished .exe will be placed.
             progress_callback: Optional callable(message) for progress updates.
+            cancel_event: Optional event; once set, the build stops at its
+                          next step (killing PyInstaller if it is running)
+                          and raises RuntimeError.  A build that has already
+                          placed its exe in *output_dir* is not cancelled.
+            tree_dict: An already-validated tree, serialized straight into
+                       the bundle instead of going through a file first.
 
         Returns:
             Path to the produced .exe file.
 
         Raises:
+            ValueError: Unless exactly one of *tree_json_path* and
+                        *tree_dict* is given.
             FileNotFoundError: If required source files are missing.
-            RuntimeError: If PyInstaller fails.
+            RuntimeError: If PyInstaller fails or the build is cancelled.
         """
-        from PIL import Image
+        if (tree_json_path is None) == (tree_dict is None):
+            raise ValueError("Pass exactly one of tree_json_path and tree_dict.")
+
+        def _check_cancelled() -> None:
+            if cancel_event is not None and cancel_event.is_set():
+                raise RuntimeError("Build cancelled.")
 
         def _log(msg: str) -> None:
+            _check_cancelled()
+            if progress_callback:
+                progress_callback(msg)
+
+        def _log_done(msg: str) -> None:
+            # The exe is in place, so a late Cancel no longer applies
             if progress_callback:
                 progress_callback(msg)
 
-        tree_json_path = Path(tree_json_path)
         logo_path = Path(logo_path)
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Locate the viewer source directory relative to this file
-        viewer_src = Path(__file__).parent.parent / "viewer"
-        if not viewer_src.exists():
-            raise FileNotFoundError(f"Viewer source directory not found: {viewer_src}")
+        viewer_src = self._viewer_source()
 
         with tempfile.TemporaryDirectory(prefix="guidewire_build_") as tmp_str:
             tmp = Path(tmp_str)
             work_dir = tmp / "viewer"
 
             _log("Copying viewer source to temporary working directory…")
-            shutil.copytree(str(viewer_src), str(work_dir))
+            _fast_clone(viewer_src, work_dir)
 
             assets_dir = work_dir / "assets"
             assets_dir.mkdir(exist_ok=True)
 
             # Inject tree.json
             _log("Injecting tree.json…")
-            shutil.copy2(str(tree_json_path), str(assets_dir / "tree.json"))
+            if tree_dict is not None:
+                (assets_dir / "tree.json").write_bytes(orjson.dumps(tree_dict))
+            else:
+                _link_or_copy(Path(tree_json_path), assets_dir / "tree.json")
 
             # Process and inject logo
             _log("Processing logo image…")
-            img = Image.open(str(logo_path)).convert("RGBA")
-            img.thumbnail((300, 300), Image.LANCZOS)
-            img.save(str(assets_dir / "logo.png"), format="PNG")
+            _write_logo(logo_path, assets_dir / "logo.png")
 
             # Write config.json
             _log("Writing config.json…")
             config = {"company_name": company_name}
-            (assets_dir / "config.json").write_text(
-                json.dumps(config, indent=2), encoding="utf-8"
+            (assets_dir / "config.json").write_bytes(
+                orjson.dumps(config, option=orjson.OPT_INDENT_2)
             )
 
             # Run PyInstaller
-            safe_name = "".join(
-                c if c.isalnum() or c in ("_", "-") else "_"
-                for c in company_name
-            )
+            safe_name = _safe_name(company_name)
             exe_name = f"GuidWire_{safe_name}"
             main_script = work_dir / "main.py"
 
+            cache_key = _exe_cache_key(work_dir, exe_name)
+            cached = _cached_exe(cache_key, exe_name)
+            if cached is not None:
+                _check_cancelled()
+                destination = output_dir / cached.name
+                shutil.copy2(str(cached), str(destination))
+                _log_done(f"Inputs unchanged — reused cached build → {destination}")
+                return destination
+
             _log(f"Running PyInstaller to build '{exe_name}'…")
             dist_dir = tmp / "dist"
             build_dir = tmp / "build"
 
+            spec_path = _write_spec(tmp, exe_name, main_script, assets_dir)
             cmd = [
                 sys.executable,
                 "-m",
                 "PyInstaller",
-                "--onefile",
-                "--windowed",
-                "--name",
-                exe_name,
+                *_PYINSTALLER_OPTIONS,
                 "--distpath",
                 str(dist_dir),
                 "--workpath",
                 str(build_dir),
-                "--specpath",
-                str(tmp),
-                "--paths",
-                str(tmp),
-                "--add-data",
-                f"{assets_dir}{os.pathsep}assets",
-                str(main_script),
+                str(spec_path),
             ]
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=str(work_dir),
-                timeout=600,
-            )
-
-            if result.returncode != 0:
-                raise RuntimeError(
-                    f"PyInstaller failed with exit code {result.returncode}.\n"
-                    f"STDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}"
-                )
+            _run_pyinstaller(cmd, work_dir, _log, cancel_event)
 
             # Find and move the produced exe
             candidates = list(dist_dir.glob(f"{exe_name}*"))
@@ -134,11 +233,14 @@ class Packager:
                     f"PyInstaller succeeded but no output executable found in {dist_dir}"
                 )
 
+            # Last point at which Cancel leaves nothing behind
+            _check_cancelled()
             exe_file = candidates[0]
+            _store_cached_exe(cache_key, exe_file)
             destination = output_dir / exe_file.name
             shutil.move(str(exe_file), str(destination))
 
-            _log(f"Build complete → {destination}")
+            _log_done(f"Build complete → {destination}")
             return destination
 
     def build_library_viewer(
@@ -182,13 +284,9 @@ class Packager:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        viewer_src = Path(__file__).parent.parent / "viewer"
-        if not viewer_src.exists():
-            raise FileNotFoundError(f"Viewer source directory not found: {viewer_src}")
+        viewer_src = self._viewer_source()
 
-        safe_name = "".join(
-            c if c.isalnum() or c in ("_", "-") else "_" for c in company_name
-        )
+        safe_name = _safe_name(company_name)
         content_folder_name = content_dir.name
         exe_name = f"GuidWire_{safe_name}_LibraryViewer"
 
@@ -197,57 +295,44 @@ class Packager:
             work_dir = tmp / "viewer"
 
             _log("Copying viewer source to temporary working directory…")
-            shutil.copytree(str(viewer_src), str(work_dir))
+            _fast_clone(viewer_src, work_dir)
 
             assets_dir = work_dir / "assets"
             assets_dir.mkdir(exist_ok=True)
 
             # Embed a small config so the viewer knows the content folder name
             _log("Writing viewer_config.json…")
-            (assets_dir / "viewer_config.json").write_text(
-                json.dumps({"content_folder": content_folder_name}, indent=2),
-                encoding="utf-8",
+            (assets_dir / "viewer_config.json").write_bytes(
+                orjson.dumps({"content_folder": content_folder_name}, option=orjson.OPT_INDENT_2)
             )
 
+            cache_key = _exe_cache_key(work_dir, exe_name)
+            cached = _cached_exe(cache_key, exe_name)
+            if cached is not None:
+                destination = output_dir / cached.name
+                shutil.copy2(str(cached), str(destination))
+                _log(f"Inputs unchanged — reused cached build → {destination}")
+                return destination
+
             main_script = work_dir / "library_main.py"
             dist_dir = tmp / "dist"
             build_dir = tmp / "build"
 
             _log(f"Running PyInstaller to build '{exe_name}'…")
+            spec_path = _write_spec(tmp, exe_name, main_script, assets_dir)
             cmd = [
                 sys.executable,
                 "-m",
                 "PyInstaller",
-                "--onefile",
-                "--windowed",
-                "--name",
-                exe_name,
+                *_PYINSTALLER_OPTIONS,
                 "--distpath",
                 str(dist_dir),
                 "--workpath",
                 str(build_dir),
-                "--specpath",
-                str(tmp),
-                "--paths",
-                str(tmp),
-                "--add-data",
-                f"{assets_dir}{os.pathsep}assets",
-                str(main_script),
+                str(spec_path),
             ]
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=str(work_dir),
-                timeout=600,
-            )
-
-            if result.returncode != 0:
-                raise RuntimeError(
-                    f"PyInstaller failed with exit code {result.returncode}.\n"
-                    f"STDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}"
-                )
+            _run_pyinstaller(cmd, work_dir, _log)
 
             candidates = list(dist_dir.glob(f"{exe_name}*"))
             if not candidates:
@@ -256,8 +341,329 @@ class Packager:
                 )
 
             exe_file = candidates[0]
+            _store_cached_exe(cache_key, exe_file)
             destination = output_dir / exe_file.name
             shutil.move(str(exe_file), str(destination))
 
             _log(f"Build complete → {destination}")
             return destination
+
+    def _viewer_source(self) -> Path:
+        """Return the viewer source directory, located once per instance.
+
+        Raises:
+            FileNotFoundError: If the directory does not exist.
+        """
+        if self._viewer_src is None:
+            # Locate the viewer source directory relative to this file
+            viewer_src = Path(__file__).parent.parent / "viewer"
+            if not viewer_src.exists():
+                raise FileNotFoundError(f"Viewer source directory not found: {viewer_src}")
+            self._viewer_src = viewer_src
+        return self._viewer_src
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+# Sub-folders of the viewer whose files the build overwrites; these must be
+# real copies, since writing through a hard link would modify the source.
+_COPY_DIRS = frozenset({"assets"})
+
+
+def _fast_clone(src: Path, dst: Path, copy_files: bool = False) -> None:
+    """Recreate the *src* tree at *dst* using hard links where possible.
+
+    Viewer sources are only read by PyInstaller, so linking them avoids
+    copying any bytes.  Files under :data:`_COPY_DIRS` are copied, and any
+    file that cannot be linked (e.g. *dst* on another volume) falls back to
+    ``shutil.copy2``.  ``__pycache__`` folders are skipped.
+    """
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as it:
+        for entry in it:
+            target = dst / entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != "__pycache__":
+                    _fast_clone(Path(entry.path), target, copy_files or entry.name in _COPY_DIRS)
+                continue
+            if copy_files:
+                shutil.copy2(entry.path, target)
+            else:
+                _link_or_copy(Path(entry.path), target)
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hard-link *src* to *dst*, replacing *dst*; copy if linking fails.
+
+    Only use this for files nothing will write to afterwards: a hard link
+    shares its data with *src*.
+    """
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:  # e.g. different volume, or a filesystem without links
+        shutil.copy2(src, dst)
+
+
+@functools.lru_cache(maxsize=1)
+def _pil_image() -> Any:
+    """Import ``PIL.Image`` on first use and reuse it for later builds."""
+    from PIL import Image
+
+    return Image
+
+
+@functools.lru_cache(maxsize=1)
+def _pyvips() -> Any:
+    """Return the ``pyvips`` module, or *None* if libvips is unavailable."""
+    try:
+        import pyvips
+    except (ImportError, OSError):  # OSError: binding present, libvips missing
+        return None
+    return pyvips
+
+
+def _write_logo(logo_path: Path, dest: Path) -> None:
+    """Shrink *logo_path* to fit 300×300 and save it as PNG at *dest*.
+
+    Uses libvips (``pyvips``) when installed, which decodes at reduced
+    scale and resizes faster and with less memory than Pillow; otherwise
+    Pillow.  If ``oxipng`` is on PATH the PNG is then losslessly recompressed
+    to keep the embedded asset small; if it fails or exceeds
+    ``_OXIPNG_TIMEOUT`` the unoptimized PNG is kept.
+    """
+    pyvips = _pyvips()
+    if pyvips is not None:
+        image = pyvips.Image.thumbnail(str(logo_path), 300, height=300, size="down")
+        image.pngsave(str(dest), compression=9)
+    else:
+        Image = _pil_image()
+
+        img = Image.open(str(logo_path))
+        # JPEGs decode straight at a reduced DCT scale (no-op for others)
+        img.draft("RGB", (600, 600))
+        img = img.convert("RGBA")
+        img.thumbnail((300, 300), Image.LANCZOS, reducing_gap=3.0)
+        img.save(str(dest), format="PNG", optimize=True)
+
+    oxipng = shutil.which("oxipng")
+    if oxipng:
+        # Write to a side file so a killed run cannot leave dest truncated
+        optimized = dest.with_name(dest.stem + ".oxipng" + dest.suffix)
+        try:
+            result = subprocess.run(
+                [oxipng, "-o", "4", "--strip", "safe", "--out", str(optimized), str(dest)],
+                capture_output=True, check=False, timeout=_OXIPNG_TIMEOUT,
+            )
+            if result.returncode == 0 and optimized.exists():
+                os.replace(optimized, dest)
+        except (subprocess.TimeoutExpired, OSError):
+            pass  # Keep the unoptimized PNG
+        finally:
+            optimized.unlink(missing_ok=True)
+
+
+@functools.lru_cache(maxsize=256)
+@functools.lru_cache(maxsize=64)
+def _safe_name(company_name: str) -> str:
+    """Return *company_name* with every character that is not alphanumeric
+    (in any script), ``_`` or ``-`` replaced by ``_``."""
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in company_name)
+
+
+def _write_spec(tmp: Path, exe_name: str, main_script: Path, assets_dir: Path) -> Path:
+    """Render :data:`_SPEC_TEMPLATE` for one build and return its path.
+
+    *tmp* is both where the spec is written and the import root, so the
+    ``viewer`` package resolves as it does when run from source.
+    """
+    spec_path = tmp / f"{exe_name}.spec"
+    spec_path.write_text(
+        _SPEC_TEMPLATE.format(
+            script=str(main_script),
+            pathex=str(tmp),
+            datas=_collect_datas(assets_dir, "assets"),
+            excludes=list(_EXCLUDED_MODULES),
+            name=exe_name,
+        ),
+        encoding="utf-8",
+    )
+    return spec_path
+
+
+def _collect_datas(src: Path, dest: str) -> list[tuple[str, str]]:
+    """List every file under *src* as a spec ``datas`` ``(file, dest_dir)`` pair.
+
+    A single ``os.scandir`` walk, using each DirEntry's cached type, so
+    PyInstaller gets explicit files instead of re-walking the folder.
+    """
+    datas: list[tuple[str, str]] = []
+    with os.scandir(src) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                datas.extend(_collect_datas(Path(entry.path), f"{dest}/{entry.name}"))
+            elif entry.is_file():
+                datas.append((entry.path, dest))
+    return sorted(datas)
+
+
+def _run_pyinstaller(
+    cmd: list[str],
+    cwd: Path,
+    log: Callable[[str], None],
+    cancel_event: threading.Event | None = None,
+) -> None:
+    """Run PyInstaller, forwarding each output line to *log* as it arrives.
+
+    Only the last :data:`_LOG_TAIL_LINES` lines are kept for the error
+    message instead of buffering the whole log.  A watcher thread kills
+    PyInstaller once *cancel_event* is set or the timeout passes, whether
+    or not it is producing output.
+
+    Raises:
+        RuntimeError: If PyInstaller exits non-zero, exceeds the timeout or
+                      is cancelled.
+    """
+    tail: deque[str] = deque(maxlen=_LOG_TAIL_LINES)
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        cwd=str(cwd),
+    )
+    timed_out = threading.Event()
+    cancelled = threading.Event()
+    wake = cancel_event if cancel_event is not None else threading.Event()
+
+    def _watch() -> None:
+        deadline = time.monotonic() + _PYINSTALLER_TIMEOUT
+        while proc.poll() is None:
+            if wake.wait(_CANCEL_POLL_SECONDS):
+                cancelled.set()
+            elif time.monotonic() >= deadline:
+                timed_out.set()
+            else:
+                continue
+            proc.kill()
+            return
+
+    watcher = threading.Thread(target=_watch, daemon=True)
+    watcher.start()
+    try:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            line = line.rstrip()
+            if line:
+                tail.append(line)
+                log(line)
+        returncode = proc.wait()
+    except BaseException:
+        # *log* raised (e.g. the build was cancelled): don't leave
+        # PyInstaller running on its own
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        watcher.join()
+
+    if cancelled.is_set():
+        raise RuntimeError("Build cancelled.")
+    if timed_out.is_set():
+        raise RuntimeError(f"PyInstaller timed out after {_PYINSTALLER_TIMEOUT} seconds.")
+    if returncode != 0:
+        output = "\n".join(tail)
+        raise RuntimeError(
+            f"PyInstaller failed with exit code {returncode}.\n"
+            f"Output (last {len(tail)} lines):\n{output}"
+        )
+
+
+def _exe_cache_key(work_dir: Path, exe_name: str) -> str:
+    """Hash the staged viewer tree plus everything else PyInstaller sees."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    versions = []
+    for dist in _BUNDLED_DISTRIBUTIONS:
+        try:
+            versions.append(f"{dist}=={version(dist)}")
+        except PackageNotFoundError:
+            versions.append(f"{dist} missing")  # Still a stable key
+
+    h = hashlib.sha256()
+    header = [
+        exe_name,
+        *versions,
+        sys.version,
+        sys.platform,
+        _SPEC_TEMPLATE,
+        *_EXCLUDED_MODULES,
+        *_PYINSTALLER_OPTIONS,
+    ]
+    h.update("\0".join(header).encode("utf-8"))
+    for path in sorted(p for p in work_dir.rglob("*") if p.is_file()):
+        h.update(b"\0" + path.relative_to(work_dir).as_posix().encode("utf-8") + b"\0")
+        with path.open("rb") as fh:
+            h.update(hashlib.file_digest(fh, "sha256").digest())
+    return h.hexdigest()
+
+
+def _cached_exe(cache_key: str, exe_name: str) -> Path | None:
+    """Return a previously built exe for *cache_key*, if any."""
+    entry_dir = _EXE_CACHE_DIR / cache_key
+    if not entry_dir.is_dir():
+        return None
+    candidates = [p for p in entry_dir.glob(f"{exe_name}*") if p.suffix != ".tmp"]
+    if not candidates:
+        return None
+    try:
+        os.utime(entry_dir)  # Mark as recently used for eviction
+    except OSError:
+        pass
+    return candidates[0]
+
+
+def _store_cached_exe(cache_key: str, exe_file: Path) -> None:
+    """Copy a freshly built exe into the cache; failures are ignored."""
+    entry_dir = _EXE_CACHE_DIR / cache_key
+    tmp_path: Path | None = None
+    try:
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        # A unique temp name, so concurrent builds of the same key don't
+        # write over each other's partial copy
+        fd, tmp_name = tempfile.mkstemp(dir=entry_dir, suffix=".tmp")
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        shutil.copy2(str(exe_file), str(tmp_path))
+        os.replace(tmp_path, entry_dir / exe_file.name)
+    except OSError:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        return  # The cache is an optimization only
+    _evict_cached_exes()
+
+
+def _evict_cached_exes() -> None:
+    """Delete least recently used cache entries until at most
+    ``_EXE_CACHE_MAX_ENTRIES`` remain, using ``_EXE_CACHE_MAX_BYTES`` in all."""
+    entries: list[tuple[float, int, Path]] = []
+    try:
+        for entry_dir in _EXE_CACHE_DIR.iterdir():
+            if not entry_dir.is_dir():
+                continue
+            size = sum(p.stat().st_size for p in entry_dir.iterdir() if p.is_file())
+            entries.append((entry_dir.stat().st_mtime, size, entry_dir))
+    except OSError:
+        return
+
+    total = sum(size for _, size, _ in entries)
+    count = len(entries)
+    for _, size, entry_dir in sorted(entries):
+        if total <= _EXE_CACHE_MAX_BYTES and count <= _EXE_CACHE_MAX_ENTRIES:
+            break
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        total -= size
+        count -= 1
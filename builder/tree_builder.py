@@ -1,9 +1,21 @@
 """Tree validation and persistence module for GuidWire Builder."""
 
-import json
+import functools
+import hashlib
+import threading
+from collections import deque
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+# Canonical-JSON digests of trees that already passed validation, shared by
+# all TreeBuilder instances so rebuilding an unchanged (LLM-cached) library
+# skips the walk.  Insertion-ordered dict used as a bounded FIFO.
+_VALIDATED: dict[str, None] = {}
+_VALIDATED_MAX = 4096
+_VALIDATED_LOCK = threading.Lock()
+
 
 class TreeBuilder:
     """Validates and saves GuidWire decision-tree data structures."""
@@ -11,6 +23,9 @@ class TreeBuilder:
     def validate(self, tree_dict: dict[str, Any]) -> bool:
         """Validate the structure of a tree dictionary.
 
+        Trees identical (as canonical JSON) to one that already passed are
+        accepted without walking them again.
+
         Args:
             tree_dict: The tree dict produced by DocumentAnalyzer.
 
@@ -20,6 +35,40 @@ class TreeBuilder:
         Raises:
             ValueError: With a descriptive message if validation fails.
         """
+        try:
+            key = hashlib.sha256(
+                orjson.dumps(tree_dict, option=orjson.OPT_SORT_KEYS)
+            ).hexdigest()
+        except TypeError:
+            key = None  # Not JSON-serializable; validate without memoizing
+
+        if key is not None and key in _VALIDATED:
+            return True
+
+        self._validate(tree_dict)
+
+        if key is not None:
+            with _VALIDATED_LOCK:
+                if len(_VALIDATED) >= _VALIDATED_MAX:
+                    _VALIDATED.pop(next(iter(_VALIDATED)))
+                _VALIDATED[key] = None
+        return True
+
+    def _validate(self, tree_dict: dict[str, Any]) -> None:
+        """Run the full structural validation of *tree_dict*.
+
+        When ``msgspec`` is installed the key/type checks run in its compiled
+        decoder and only the reference/reachability walk stays in Python.
+        Anything that path cannot accept is re-checked by the pure-Python
+        validator, which raises the descriptive error (or accepts the looser
+        shapes it has always allowed).
+        """
+        if _fast_validate(tree_dict):
+            return
+        self._validate_python(tree_dict)
+
+    def _validate_python(self, tree_dict: dict[str, Any]) -> None:
+        """Pure-Python validation; raises ValueError describing any problem."""
         if "title" not in tree_dict:
             raise ValueError("Tree is missing required key: 'title'")
         if "nodes" not in tree_dict:
@@ -29,19 +78,20 @@ class TreeBuilder:
         if not isinstance(nodes, list) or len(nodes) == 0:
             raise ValueError("'nodes' must be a non-empty list")
 
-        # Build a set of all known node ids for reference validation
-        node_ids: set[str] = set()
+        # Index nodes by id; references are checked against this index once
+        # every id is known.
+        node_index: dict[str, dict[str, Any]] = {}
         for node in nodes:
             for key in ("id", "type", "text"):
                 if key not in node:
                     raise ValueError(f"Node is missing required key: '{key}'. Node: {node}")
-            node_ids.add(node["id"])
+            node_index[node["id"]] = node
 
-        if "start" not in node_ids:
+        if "start" not in node_index:
             raise ValueError("Tree must contain a node with id 'start'")
 
         # Build an adjacency map to enable reachability traversal from 'start'
-        adjacency: dict[str, list[str]] = {nid: [] for nid in node_ids}
+        adjacency: dict[str, list[str]] = {nid: [] for nid in node_index}
         for node in nodes:
             node_type: str = node["type"]
             node_id: str = node["id"]
@@ -53,18 +103,21 @@ class TreeBuilder:
                         f"Question node '{node_id}' must have an 'options' list "
                         "with at least 2 entries"
                     )
+                adj = adjacency[node_id]
+                contains = node_index.__contains__
                 for opt in options:
                     if "label" not in opt or "next" not in opt:
                         raise ValueError(
                             f"Each option in question node '{node_id}' must have "
                             "'label' and 'next' keys"
                         )
-                    if opt["next"] not in node_ids:
+                    nxt = opt["next"]
+                    if not contains(nxt):
                         raise ValueError(
                             f"Option '{opt['label']}' in node '{node_id}' references "
-                            f"unknown node id: '{opt['next']}'"
+                            f"unknown node id: '{nxt}'"
                         )
-                    adjacency[node_id].append(opt["next"])
+                    adj.append(nxt)
 
             elif node_type == "step":
                 next_id = node.get("next")
@@ -72,7 +125,7 @@ class TreeBuilder:
                     raise ValueError(
                         f"Step node '{node_id}' must have a 'next' field"
                     )
-                if next_id not in node_ids:
+                if next_id not in node_index:
                     raise ValueError(
                         f"Step node '{node_id}' references unknown node id: '{next_id}'"
                     )
@@ -91,24 +144,21 @@ class TreeBuilder:
                 )
 
         # BFS from 'start' to find all nodes reachable through the tree
-        visited: set[str] = set()
-        queue: list[str] = ["start"]
+        visited: set[str] = {"start"}
+        queue: deque[str] = deque(["start"])
         while queue:
-            current = queue.pop()
-            if current in visited:
-                continue
-            visited.add(current)
-            queue.extend(adjacency[current])
+            for next_id in adjacency[queue.popleft()]:
+                if next_id not in visited:
+                    visited.add(next_id)
+                    queue.append(next_id)
 
-        unreachable = node_ids - visited
+        unreachable = [nid for nid in node_index if nid not in visited]
         if unreachable:
             raise ValueError(
                 f"The following nodes are unreachable from 'start': "
                 f"{sorted(unreachable)}"
             )
 
-        return True
-
     def save(self, tree_dict: dict[str, Any], output_path: str | Path) -> Path:
         """Write the tree dictionary to a JSON file.
 
@@ -121,8 +171,90 @@ class TreeBuilder:
         """
         path = Path(output_path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(
-            json.dumps(tree_dict, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        path.write_bytes(orjson.dumps(tree_dict, option=orjson.OPT_INDENT_2))
         return path.resolve()
+
+
+@functools.lru_cache(maxsize=None)
+def _msgspec_schema() -> Any:
+    """Return ``(msgspec, Tree)`` for the compiled validator, or *None*."""
+    try:
+        import msgspec
+    except ImportError:
+        return None
+    from typing import Annotated, Union
+
+    class Option(msgspec.Struct):
+        label: str
+        next: str
+
+    class Question(msgspec.Struct, tag="question", tag_field="type"):
+        id: str
+        text: str
+        options: Annotated[list[Option], msgspec.Meta(min_length=2)]
+
+    class Step(msgspec.Struct, tag="step", tag_field="type"):
+        id: str
+        text: str
+        next: str
+
+    class Resolution(msgspec.Struct, tag="resolution", tag_field="type"):
+        id: str
+        text: str
+        next: Any = None
+        options: Any = None
+
+    class Tree(msgspec.Struct):
+        title: Any
+        nodes: Annotated[list[Union[Question, Step, Resolution]], msgspec.Meta(min_length=1)]
+
+    return msgspec, Tree
+
+
+def _fast_validate(tree_dict: dict[str, Any]) -> bool:
+    """Return True if *tree_dict* is valid per the msgspec schema.
+
+    False means "not proven valid" (msgspec missing, or some check failed);
+    the caller then runs the pure-Python validator for the verdict.
+    """
+    schema = _msgspec_schema()
+    if schema is None:
+        return False
+    msgspec, tree_type = schema
+    try:
+        tree = msgspec.convert(tree_dict, tree_type)
+    except msgspec.ValidationError:
+        return False
+
+    nodes = tree.nodes
+    node_index = {node.id: node for node in nodes}
+    if len(node_index) != len(nodes) or "start" not in node_index:
+        return False
+
+    adjacency: dict[str, list[str]] = {}
+    for node in nodes:
+        options = getattr(node, "options", None)
+        next_id = getattr(node, "next", None)
+        tag = type(node).__struct_config__.tag
+        if tag == "question":
+            targets = [opt.next for opt in options]
+        elif tag == "step":
+            if not next_id:
+                return False
+            targets = [next_id]
+        else:
+            if next_id or options:
+                return False
+            targets = []
+        if not all(t in node_index for t in targets):
+            return False
+        adjacency[node.id] = targets
+
+    visited: set[str] = {"start"}
+    queue: deque[str] = deque(["start"])
+    while queue:
+        for next_id in adjacency[queue.popleft()]:
+            if next_id not in visited:
+                visited.add(next_id)
+                queue.append(next_id)
+    return len(visited) == len(node_index)
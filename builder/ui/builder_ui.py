@@ -2,23 +2,63 @@
 
 from __future__ import annotations
 
+import functools
+import queue
+import re
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from tkinter import filedialog, messagebox
-from typing import Any
+from tkinter import filedialog, messagebox, ttk
+from typing import TYPE_CHECKING, Any, Iterator
 
 import customtkinter as ctk
-from PIL import Image, ImageTk
 
-from builder.analyzer import DocumentAnalyzer
-from builder.bulk_ingestor import BulkIngestor
-from builder.ingestor import DocumentIngestor
-from builder.library_builder import LibraryBuilder
-from builder.packager import Packager
-from builder.tree_builder import TreeBuilder
+# Backends and Pillow are imported where first used (mostly on worker
+# threads) so the window paints without waiting on them.
+if TYPE_CHECKING:
+    from PIL import ImageTk
+
+    from builder.bulk_ingestor import BulkIngestor
+    from builder.library_builder import LibraryBuilder
+    from builder.packager import Packager
 
 _LOGO_THUMB_SIZE: tuple[int, int] = (80, 80)
 
+# Decoded logo previews kept for re-picked files; the oldest is dropped first
+_LOGO_CACHE_SIZE = 8
+
+# Google API keys: "AIza" followed by 35 URL-safe characters.  Checked
+# before starting a worker so a mistyped key fails instantly instead of
+# after ingestion and a rejected API round-trip.
+_API_KEY_RE = re.compile(r"AIza[0-9A-Za-z_\-]{35}")
+
+# Document types DocumentIngestor accepts in single-document mode
+_ACCEPTED_SUFFIXES: tuple[str, ...] = (".pdf", ".docx", ".html", ".htm", ".txt")
+
+# Worker threads post UI updates to a queue that the Tk loop drains every
+# _UI_POLL_MS, at most _UI_BATCH items per tick so the window stays
+# responsive during chatty progress output.
+_UI_POLL_MS = 50
+_UI_BATCH = 200
+
+# Bulk log textboxes keep only the newest lines; Tk's text widget slows
+# down as it grows, so a long run would otherwise drag every append.
+_MAX_LOG_LINES = 2000
+
+# Badge colours for node types in the Step 3 preview
+_NODE_TYPE_COLORS: dict[str, str] = {
+    "question": "#2196F3",
+    "step": "#FF9800",
+    "resolution": "#4CAF50",
+}
+
+
+def _node_preview(node: dict[str, Any]) -> str:
+    """One-line "[id] text…" summary of *node* for the Step 3 list."""
+    text = node.get("text", "")
+    return f"[{node.get('id', '?')}] {text[:80]}" + ("…" if len(text) > 80 else "")
+
 
 # ---------------------------------------------------------------------------
 # Appearance defaults
@@ -50,6 +90,7 @@ class NodeEditDialog(ctk.CTkToplevel):
 
         self._text_box = ctk.CTkTextbox(self, height=100)
         self._text_box.insert("1.0", node.get("text", ""))
+        self._text_box.edit_modified(False)
         self._text_box.pack(fill="x", padx=20, pady=5)
 
         btn_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -59,7 +100,13 @@ class NodeEditDialog(ctk.CTkToplevel):
                       command=self.destroy).pack(side="left", padx=5)
 
     def _save(self) -> None:
-        self._result = self._text_box.get("1.0", "end").strip()
+        # Leave result as None when nothing changed, so the caller skips the
+        # update; Tk's modified flag avoids reading the text back at all in
+        # the common open-and-save case
+        if self._text_box.edit_modified():
+            text = self._text_box.get("1.0", "end").strip()
+            if text != self._node.get("text", ""):
+                self._result = text
         self.destroy()
 
     @property
@@ -85,6 +132,10 @@ class BuilderUI(ctk.CTk):
         # --- Single-document mode state ---
         self._file_path: Path | None = None
         self._logo_path: Path | None = None
+        # Decoded logo previews keyed by (path, mtime_ns), least recently
+        # used first and capped at _LOGO_CACHE_SIZE; the preview label holds
+        # its own reference to the image it shows
+        self._logo_cache: dict[tuple[Path, int], ImageTk.PhotoImage] = {}
         self._output_dir: Path | None = None
         self._tree_dict: dict[str, Any] | None = None
         self._current_step: int = 1
@@ -93,13 +144,110 @@ class BuilderUI(ctk.CTk):
         self._bulk_source_root: Path | None = None
         self._bulk_output_base: Path | None = None
         self._bulk_manifest: dict[str, Any] | None = None
+        self._bulk_file_count: int | None = None  # From the latest folder scan
+        # One ingest (which writes the manifest) and one generate (which
+        # writes library.json) at a time; see _update_bulk_controls
+        self._bulk_ingest_busy = False
+        self._bulk_gen_busy = False
         self._bulk_library_path: Path | None = None
         self._bulk_current_step: int = 1
         self._bulk_exe_output_dir: Path | None = None
+        self._scan_token: int = 0
+        self._last_api_key: str | None = None  # Last key Gemini accepted
+        # Set by the Cancel buttons; replaced on every run
+        self._analysis_cancel = threading.Event()
+        self._build_cancel = threading.Event()
 
         self._mode: str = "single"  # "single" | "bulk"
+        self._last_indicator_state: tuple[str, int] | None = None
+
+        # Shared fonts — each CTkFont is a Tk named font, so create them once
+        self._font_heading = ctk.CTkFont(size=22, weight="bold")
+        self._font_action = ctk.CTkFont(size=15, weight="bold")
+        self._font_active = ctk.CTkFont(size=13, weight="bold")
+        self._font_step = ctk.CTkFont(size=13)
+        self._font_body = ctk.CTkFont(size=12)
+        self._font_small = ctk.CTkFont(size=11)
+
+        # (callable, args, kwargs) posted by worker threads; see _post
+        self._ui_queue: queue.SimpleQueue[tuple[Any, tuple, dict]] = queue.SimpleQueue()
+        # (status label, log textbox, progress bar or None, line, fraction
+        # done) from bulk progress callbacks, coalesced by _flush_log on each
+        # UI tick
+        self._log_queue: deque[
+            tuple[ctk.CTkLabel, ctk.CTkTextbox, ctk.CTkProgressBar | None, str, float]
+        ] = deque()
+        self._log_line_count: dict[ctk.CTkTextbox, int] = {}
+        # Latest single-mode status message per label; see _post_status
+        self._pending_status: dict[ctk.CTkLabel, str] = {}
+
+        # While minimized, queued updates are held back and applied in one
+        # go once the window is shown again (see _drain_ui_queue)
+        self._is_minimized = False
+        self.bind("<Unmap>", self._on_unmap, add="+")
+        self.bind("<Map>", self._on_map, add="+")
 
         self._build_layout()
+        self.after(_UI_POLL_MS, self._drain_ui_queue)
+        threading.Thread(target=self._prewarm, daemon=True).start()
+
+    # ------------------------------------------------------------------
+    # Backends — created on first use and shared for the session (the
+    # packager, for one, caches the located viewer sources between builds)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _prewarm() -> None:
+        """Load what the first clicks will need, in the background after startup.
+
+        The window opens without waiting for the backend modules, and by the
+        time the user reaches a Start button the workers' local imports are
+        dictionary lookups.  Failures are left for the worker to report in
+        the UI.  On Windows the common-dialog and shell DLLs are mapped too,
+        so the first Browse… does not pay for loading them.
+        """
+        import importlib
+        import sys
+
+        if sys.platform == "win32":
+            import ctypes
+
+            for dll in ("comdlg32", "shell32"):
+                try:
+                    ctypes.WinDLL(dll)
+                except OSError:
+                    pass
+
+        for name in (
+            "builder.ingestor",
+            "builder.analyzer",
+            "builder.tree_builder",
+            "builder.packager",
+            "builder.bulk_ingestor",
+            "builder.library_builder",
+        ):
+            try:
+                importlib.import_module(name)
+            except Exception:  # noqa: BLE001
+                pass
+
+    @functools.cached_property
+    def _bulk_ingestor(self) -> BulkIngestor:
+        from builder.bulk_ingestor import BulkIngestor
+
+        return BulkIngestor()
+
+    @functools.cached_property
+    def _library_builder(self) -> LibraryBuilder:
+        from builder.library_builder import LibraryBuilder
+
+        return LibraryBuilder()
+
+    @functools.cached_property
+    def _packager(self) -> Packager:
+        from builder.packager import Packager
+
+        return Packager()
 
     # ------------------------------------------------------------------
     # Layout construction
@@ -163,7 +311,7 @@ class BuilderUI(ctk.CTk):
             lbl = ctk.CTkLabel(
                 self._single_steps_frame,
                 text=label_text,
-                font=ctk.CTkFont(size=13),
+                font=self._font_step,
                 anchor="w",
                 text_color="gray60",
             )
@@ -183,7 +331,7 @@ class BuilderUI(ctk.CTk):
             lbl = ctk.CTkLabel(
                 self._bulk_steps_frame,
                 text=label_text,
-                font=ctk.CTkFont(size=13),
+                font=self._font_step,
                 anchor="w",
                 text_color="gray60",
             )
@@ -201,18 +349,23 @@ class BuilderUI(ctk.CTk):
         self._content.grid_columnconfigure(0, weight=1)
         self._content.grid_rowconfigure(0, weight=1)
 
-        # Build all step frames
+        # Step frames are built on first visit (see _show_step)
         self._frames: dict[int, ctk.CTkScrollableFrame] = {}
-        self._build_step1()
-        self._build_step2()
-        self._build_step3()
-        self._build_step4()
+        self._frame_builders = {
+            1: self._build_step1,
+            2: self._build_step2,
+            3: self._build_step3,
+            4: self._build_step4,
+        }
 
         self._bulk_frames: dict[int, ctk.CTkScrollableFrame] = {}
-        self._build_bulk_step1()
-        self._build_bulk_step2()
-        self._build_bulk_step3()
-        self._build_bulk_step4()
+        self._active_frame: ctk.CTkScrollableFrame | None = None
+        self._bulk_frame_builders = {
+            1: self._build_bulk_step1,
+            2: self._build_bulk_step2,
+            3: self._build_bulk_step3,
+            4: self._build_bulk_step4,
+        }
 
         self._show_step(1)
 
@@ -225,7 +378,7 @@ class BuilderUI(ctk.CTk):
         self._frames[1] = frame
 
         ctk.CTkLabel(frame, text="Upload Document",
-                     font=ctk.CTkFont(size=22, weight="bold")).pack(pady=(10, 4), anchor="w")
+                     font=self._font_heading).pack(pady=(10, 4), anchor="w")
         ctk.CTkLabel(frame, text="Select the support document you want to convert into a decision tree.",
                      text_color="gray60", wraplength=600, justify="left").pack(anchor="w", pady=(0, 20))
 
@@ -238,12 +391,12 @@ class BuilderUI(ctk.CTk):
         ctk.CTkLabel(drop_frame, text="Drag & drop a file here or click Browse",
                      text_color="gray60").pack(expand=True)
         ctk.CTkLabel(drop_frame, text="Accepted: .pdf  .docx  .html  .txt",
-                     font=ctk.CTkFont(size=11), text_color="gray50").pack(pady=(0, 10))
+                     font=self._font_small, text_color="gray50").pack(pady=(0, 10))
 
         ctk.CTkButton(frame, text="Browse File", command=self._browse_file).pack(pady=10)
 
         self._file_label = ctk.CTkLabel(frame, text="No file selected", text_color="gray50",
-                                        font=ctk.CTkFont(size=12))
+                                        font=self._font_body)
         self._file_label.pack(pady=4)
 
         ctk.CTkButton(frame, text="Next →", command=lambda: self._goto_step(2)).pack(pady=(20, 0))
@@ -257,7 +410,7 @@ class BuilderUI(ctk.CTk):
         self._frames[2] = frame
 
         ctk.CTkLabel(frame, text="Analyze Document",
-                     font=ctk.CTkFont(size=22, weight="bold")).pack(pady=(10, 4), anchor="w")
+                     font=self._font_heading).pack(pady=(10, 4), anchor="w")
         ctk.CTkLabel(frame, text="Enter your Google Gemini API key and let Gemini extract the troubleshooting tree.",
                      text_color="gray60", wraplength=600, justify="left").pack(anchor="w", pady=(0, 20))
 
@@ -267,6 +420,8 @@ class BuilderUI(ctk.CTk):
         self._api_key_entry = ctk.CTkEntry(api_row, show="•", width=360,
                                            placeholder_text="AIza…")
         self._api_key_entry.pack(side="left", padx=5)
+        if self._last_api_key:
+            self._api_key_entry.insert(0, self._last_api_key)
         self._show_key_btn = ctk.CTkButton(api_row, text="Show", width=60,
                                            command=self._toggle_api_key_visibility)
         self._show_key_btn.pack(side="left")
@@ -297,15 +452,73 @@ class BuilderUI(ctk.CTk):
         self._frames[3] = frame
 
         ctk.CTkLabel(frame, text="Preview Tree",
-                     font=ctk.CTkFont(size=22, weight="bold")).pack(pady=(10, 4), anchor="w")
+                     font=self._font_heading).pack(pady=(10, 4), anchor="w")
 
         self._node_count_label = ctk.CTkLabel(frame, text="No tree loaded.",
                                               text_color="gray60")
         self._node_count_label.pack(anchor="w", pady=(0, 10))
 
-        self._node_list_frame = ctk.CTkScrollableFrame(frame, height=360)
-        self._node_list_frame.pack(fill="both", expand=True)
-        self._node_list_frame.grid_columnconfigure(0, weight=1)
+        # A Treeview only draws the rows in view, so large trees cost the
+        # same to show as small ones.  Native ttk themes (vista, aqua) ignore
+        # custom colours, so the style's field and heading elements are
+        # cloned from the "default" theme instead of switching the global
+        # theme, which the file dialogs share.
+        style = ttk.Style(self)
+        if "GuideWire.Treeview.field" not in style.element_names():
+            style.element_create("GuideWire.Treeview.field", "from", "default", "field")
+            style.element_create("GuideWire.Treeheading.cell", "from", "default",
+                                 "Treeheading.cell")
+            style.element_create("GuideWire.Treeheading.border", "from", "default",
+                                 "Treeheading.border")
+        style.layout("GuideWire.Treeview", [
+            ("GuideWire.Treeview.field", {"sticky": "nswe", "border": "1", "children": [
+                ("Treeview.padding", {"sticky": "nswe", "children": [
+                    ("Treeview.treearea", {"sticky": "nswe"}),
+                ]}),
+            ]}),
+        ])
+        style.layout("GuideWire.Treeview.Heading", [
+            ("GuideWire.Treeheading.cell", {"sticky": "nswe"}),
+            ("GuideWire.Treeheading.border", {"sticky": "nswe", "children": [
+                ("Treeheading.padding", {"sticky": "nswe", "children": [
+                    ("Treeheading.image", {"side": "right", "sticky": ""}),
+                    ("Treeheading.text", {"sticky": "we"}),
+                ]}),
+            ]}),
+        ])
+        style.configure("GuideWire.Treeview", background="#2b2b2b",
+                        fieldbackground="#2b2b2b", foreground="white",
+                        rowheight=28, borderwidth=0)
+        style.configure("GuideWire.Treeview.Heading", background="#1f1f1f",
+                        foreground="gray70", relief="flat")
+        style.map("GuideWire.Treeview", background=[("selected", "#1F6AA5")])
+
+        list_frame = ctk.CTkFrame(frame)
+        list_frame.pack(fill="both", expand=True)
+        self._node_tree = ttk.Treeview(list_frame, columns=("type", "text"),
+                                       show="headings", height=12,
+                                       selectmode="browse", style="GuideWire.Treeview")
+        self._node_tree.heading("type", text="Type", anchor="w")
+        self._node_tree.heading("text", text="Node", anchor="w")
+        self._node_tree.column("type", width=110, stretch=False)
+        self._node_tree.column("text", width=520, stretch=True)
+        for node_type, color in _NODE_TYPE_COLORS.items():
+            self._node_tree.tag_configure(node_type, foreground=color)
+        self._node_tree.bind("<Double-1>", self._on_node_double_click)
+        scrollbar = ctk.CTkScrollbar(list_frame, command=self._node_tree.yview)
+        self._node_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        self._node_tree.pack(side="left", fill="both", expand=True)
+
+        edit_row = ctk.CTkFrame(frame, fg_color="transparent")
+        edit_row.pack(fill="x", pady=(6, 0))
+        ctk.CTkButton(edit_row, text="Edit Selected", width=110,
+                      command=self._edit_selected_node).pack(side="left")
+        ctk.CTkLabel(edit_row, text="…or double-click a node to edit its text.",
+                     font=self._font_small, text_color="gray50").pack(side="left", padx=10)
+
+        # Analysis may have finished before this step was first shown
+        self._populate_node_list()
 
         nav_row = ctk.CTkFrame(frame, fg_color="transparent")
         nav_row.pack(pady=(10, 0))
@@ -323,7 +536,7 @@ class BuilderUI(ctk.CTk):
         self._frames[4] = frame
 
         ctk.CTkLabel(frame, text="Brand & Export",
-                     font=ctk.CTkFont(size=22, weight="bold")).pack(pady=(10, 4), anchor="w")
+                     font=self._font_heading).pack(pady=(10, 4), anchor="w")
         ctk.CTkLabel(frame, text="Configure branding and build the standalone viewer .exe.",
                      text_color="gray60", wraplength=600, justify="left").pack(anchor="w", pady=(0, 20))
 
@@ -361,7 +574,7 @@ class BuilderUI(ctk.CTk):
         # Build button
         self._build_btn = ctk.CTkButton(frame, text="Build .exe",
                                         command=self._run_build, height=40,
-                                        font=ctk.CTkFont(size=15, weight="bold"))
+                                        font=self._font_action)
         self._build_btn.pack(pady=15)
 
         self._build_progress = ctk.CTkProgressBar(frame)
@@ -411,21 +624,77 @@ class BuilderUI(ctk.CTk):
         return f
 
     def _show_step(self, step: int) -> None:
-        all_frames = list(self._frames.values()) + list(self._bulk_frames.values())
-        for frame in all_frames:
-            frame.grid_remove()
-        self._frames[step].grid(row=0, column=0, sticky="nsew")
+        if step not in self._frames:
+            self._frame_builders[step]()
+        self._show_frame(self._frames[step])
         self._current_step = step
         self._update_step_indicators()
 
     def _show_bulk_step(self, step: int) -> None:
-        all_frames = list(self._frames.values()) + list(self._bulk_frames.values())
-        for frame in all_frames:
-            frame.grid_remove()
-        self._bulk_frames[step].grid(row=0, column=0, sticky="nsew")
+        if step not in self._bulk_frames:
+            self._bulk_frame_builders[step]()
+        self._show_frame(self._bulk_frames[step])
         self._bulk_current_step = step
         self._update_step_indicators()
 
+    def _show_frame(self, frame: ctk.CTkScrollableFrame) -> None:
+        """Grid *frame* in the content area, hiding the one shown before."""
+        if frame is self._active_frame:
+            return
+        if self._active_frame is not None:
+            self._active_frame.grid_remove()
+        frame.grid(row=0, column=0, sticky="nsew")
+        self._active_frame = frame
+
+    def _post(self, fn: Any, *args: Any, **kwargs: Any) -> None:
+        """Schedule ``fn(*args, **kwargs)`` on the Tk thread (thread-safe)."""
+        self._ui_queue.put((fn, args, kwargs))
+
+    def _post_status(self, label: ctk.CTkLabel, msg: str) -> None:
+        """Show *msg* on *label* at the next UI tick (thread-safe).
+
+        Only the newest message per label survives until then, so a chatty
+        progress callback costs one configure() per tick at most.
+        """
+        self._pending_status[label] = msg
+
+    def _flush_status(self) -> None:
+        while self._pending_status:
+            label, msg = self._pending_status.popitem()
+            label.configure(text=msg, text_color="gray60")
+
+    def _on_unmap(self, event: Any) -> None:
+        # The root's bindings also see child widgets' events (bindtags)
+        if event.widget is self:
+            self._is_minimized = True
+
+    def _on_map(self, event: Any) -> None:
+        if event.widget is self:
+            self._is_minimized = False
+
+    def _drain_ui_queue(self) -> None:
+        if self._is_minimized:
+            self.after(_UI_POLL_MS, self._drain_ui_queue)
+            return
+        for _ in range(_UI_BATCH):
+            try:
+                fn, args, kwargs = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            # A worker reports all its progress before posting its completion
+            # callback, so applying what is pending *after* taking the
+            # callback keeps stale progress from overwriting its result.
+            self._flush_progress()
+            fn(*args, **kwargs)
+        self._flush_progress()
+        self.after(_UI_POLL_MS, self._drain_ui_queue)
+
+    def _flush_progress(self) -> None:
+        if self._pending_status:
+            self._flush_status()
+        if self._log_queue:
+            self._flush_log()
+
     def _goto_step(self, step: int) -> None:
         self._show_step(step)
 
@@ -436,13 +705,17 @@ class BuilderUI(ctk.CTk):
         active = (
             self._current_step if self._mode == "single" else self._bulk_current_step
         )
+        state = (self._mode, active)
+        if state == self._last_indicator_state:
+            return
+        self._last_indicator_state = state
         for i, lbl in enumerate(self._step_labels, start=1):
             if i == active:
-                lbl.configure(text_color="white", font=ctk.CTkFont(size=13, weight="bold"))
+                lbl.configure(text_color="white", font=self._font_active)
             elif i < active:
-                lbl.configure(text_color="#4CAF50", font=ctk.CTkFont(size=13))
+                lbl.configure(text_color="#4CAF50", font=self._font_step)
             else:
-                lbl.configure(text_color="gray60", font=ctk.CTkFont(size=13))
+                lbl.configure(text_color="gray60", font=self._font_step)
 
     # ------------------------------------------------------------------
     # Actions — Step 1
@@ -452,7 +725,7 @@ class BuilderUI(ctk.CTk):
         path_str = filedialog.askopenfilename(
             title="Select Support Document",
             filetypes=[
-                ("Supported Documents", "*.pdf *.docx *.html *.htm *.txt"),
+                ("Supported Documents", " ".join(f"*{s}" for s in _ACCEPTED_SUFFIXES)),
                 ("PDF files", "*.pdf"),
                 ("Word documents", "*.docx"),
                 ("HTML files", "*.html *.htm"),
@@ -468,6 +741,20 @@ class BuilderUI(ctk.CTk):
     # Actions — Step 2
     # ------------------------------------------------------------------
 
+    def _check_api_key(self, api_key: str) -> bool:
+        """Warn and return False unless *api_key* looks like a Gemini key."""
+        if not api_key:
+            messagebox.showwarning("No API Key", "Please enter your Google Gemini API key.")
+            return False
+        if api_key != self._last_api_key and not _API_KEY_RE.fullmatch(api_key):
+            messagebox.showwarning(
+                "Invalid API Key",
+                "This does not look like a Google Gemini API key "
+                "(39 characters starting with \"AIza\").",
+            )
+            return False
+        return True
+
     def _toggle_api_key_visibility(self) -> None:
         current = self._api_key_entry.cget("show")
         if current == "•":
@@ -483,54 +770,99 @@ class BuilderUI(ctk.CTk):
             return
 
         api_key = self._api_key_entry.get().strip()
-        if not api_key:
-            messagebox.showwarning("No API Key", "Please enter your Google Gemini API key.")
+        if not self._check_api_key(api_key):
             return
 
-        self._analyze_btn.configure(state="disabled")
+        # A fresh event per run, so a cancelled worker that is still waiting
+        # on Gemini never sees the next run's state
+        cancel = self._analysis_cancel = threading.Event()
+        self._analyze_btn.configure(text="Cancel", command=self._cancel_analysis)
         self._analysis_progress.pack(pady=5)
         self._analysis_progress.start()
 
         def _worker() -> None:
             try:
-                ingestor = DocumentIngestor()
-                raw_text = ingestor.ingest(self._file_path)
-
-                self.after(0, lambda: self._analysis_status.configure(
-                    text="Sending to Gemini for analysis…", text_color="gray60"))
+                from builder.analyzer import DocumentAnalyzer
+                from builder.ingestor import DocumentIngestor
+                from builder.tree_builder import TreeBuilder
+
+                # Importing and configuring the Gemini client takes about as
+                # long as parsing a typical document, so do both at once.
+                with ThreadPoolExecutor(max_workers=1) as pool:
+                    analyzer_future = pool.submit(DocumentAnalyzer, api_key)
+                    ingestor = DocumentIngestor()
+                    raw_text = ingestor.ingest(self._file_path)
+                    analyzer = analyzer_future.result()
+
+                if cancel.is_set():
+                    return
+                self._post(self._show_analysis_stage, cancel,
+                           "Sending to Gemini for analysis…")
 
-                analyzer = DocumentAnalyzer(api_key)
                 tree_dict = analyzer.analyze(raw_text)
+                if cancel.is_set():
+                    return
 
                 validator = TreeBuilder()
-                validator.validate(tree_dict)
-
-                self._tree_dict = tree_dict
-
-                self.after(0, self._on_analysis_success)
+                try:
+                    validator.validate(tree_dict)
+                except ValueError:
+                    # Let a retry ask Gemini again instead of the cached tree
+                    analyzer.discard_cached(raw_text)
+                    raise
+
+                self._post(self._on_analysis_success, cancel, tree_dict, api_key)
             except Exception as exc:
-                self.after(0, lambda: self._on_analysis_error(str(exc)))
+                self._post(self._on_analysis_error, cancel, str(exc))
 
         threading.Thread(target=_worker, daemon=True).start()
 
-    def _on_analysis_success(self) -> None:
+    def _cancel_analysis(self) -> None:
+        # The Gemini request itself cannot be interrupted; the worker drops
+        # its result instead, so the UI is free again right away.
+        self._analysis_cancel.set()
+        self._reset_analysis_controls()
+        self._analysis_status.configure(text="Analysis cancelled.", text_color="gray60")
+
+    def _is_live_analysis(self, cancel: threading.Event) -> bool:
+        """Whether the run owning *cancel* is still the current, uncancelled one.
+
+        Checked on the Tk thread by every callback a worker posts: Cancel
+        may be pressed, or a new run started, after the worker's own checks.
+        """
+        return cancel is self._analysis_cancel and not cancel.is_set()
+
+    def _show_analysis_stage(self, cancel: threading.Event, msg: str) -> None:
+        if self._is_live_analysis(cancel):
+            self._analysis_status.configure(text=msg, text_color="gray60")
+
+    def _reset_analysis_controls(self) -> None:
         self._analysis_progress.stop()
         self._analysis_progress.pack_forget()
+        self._analyze_btn.configure(text="Analyze Document", command=self._run_analysis)
+
+    def _on_analysis_success(self, cancel: threading.Event, tree_dict: dict[str, Any],
+                             api_key: str) -> None:
+        if not self._is_live_analysis(cancel):
+            return
+        self._tree_dict = tree_dict
+        self._last_api_key = api_key
+        self._reset_analysis_controls()
         node_count = len(self._tree_dict.get("nodes", []))
         self._analysis_status.configure(
             text=f"✓ Analysis complete! Extracted {node_count} nodes. "
                  f"Title: {self._tree_dict.get('title', 'N/A')}",
             text_color="#4CAF50",
         )
-        self._analyze_btn.configure(state="normal")
-        self._populate_node_list()
+        if 3 in self._frames:
+            self._populate_node_list()
 
-    def _on_analysis_error(self, error_msg: str) -> None:
-        self._analysis_progress.stop()
-        self._analysis_progress.pack_forget()
+    def _on_analysis_error(self, cancel: threading.Event, error_msg: str) -> None:
+        if not self._is_live_analysis(cancel):
+            return
+        self._reset_analysis_controls()
         self._analysis_status.configure(
             text=f"✗ Error: {error_msg}", text_color="#F44336")
-        self._analyze_btn.configure(state="normal")
 
     # ------------------------------------------------------------------
     # Actions — Step 3
@@ -540,46 +872,43 @@ class BuilderUI(ctk.CTk):
         if not self._tree_dict:
             return
 
-        # Clear existing widgets
-        for widget in self._node_list_frame.winfo_children():
-            widget.destroy()
-
         nodes = self._tree_dict.get("nodes", [])
         self._node_count_label.configure(
             text=f"{len(nodes)} nodes extracted  |  Title: {self._tree_dict.get('title', 'N/A')}",
             text_color="white",
         )
 
-        type_colors = {"question": "#2196F3", "step": "#FF9800", "resolution": "#4CAF50"}
-
+        tree = self._node_tree
+        tree.delete(*tree.get_children())
         for idx, node in enumerate(nodes):
-            row = ctk.CTkFrame(self._node_list_frame, corner_radius=8)
-            row.grid(row=idx, column=0, sticky="ew", pady=3, padx=2)
-            row.grid_columnconfigure(1, weight=1)
-
-            color = type_colors.get(node.get("type", ""), "gray50")
-            ctk.CTkLabel(row, text=node.get("type", "?").upper(),
-                         width=90, fg_color=color, corner_radius=6,
-                         font=ctk.CTkFont(size=10, weight="bold"),
-                         text_color="white").grid(row=0, column=0, padx=6, pady=6)
-
-            text_preview = node.get("text", "")[:80] + ("…" if len(node.get("text", "")) > 80 else "")
-            ctk.CTkLabel(row, text=f"[{node.get('id', '?')}] {text_preview}",
-                         anchor="w", justify="left", wraplength=440).grid(
-                row=0, column=1, padx=6, pady=6, sticky="ew")
-
-            # Capture loop variable for lambda
-            node_ref = node
-            ctk.CTkButton(row, text="Edit", width=55,
-                          command=lambda n=node_ref: self._edit_node(n)).grid(
-                row=0, column=2, padx=6, pady=6)
-
-    def _edit_node(self, node: dict[str, Any]) -> None:
+            node_type = node.get("type", "")
+            tree.insert("", "end", iid=str(idx),
+                        values=((node_type or "?").upper(), _node_preview(node)),
+                        tags=(node_type,))
+
+    def _update_single_node_row(self, idx: int, node: dict[str, Any]) -> None:
+        """Refresh only the text preview of row *idx* (after an edit)."""
+        self._node_tree.set(str(idx), "text", _node_preview(node))
+
+    def _on_node_double_click(self, event: Any) -> None:
+        row = self._node_tree.identify_row(event.y)
+        if row:
+            self._edit_node(int(row))
+
+    def _edit_selected_node(self) -> None:
+        selection = self._node_tree.selection()
+        if not selection:
+            messagebox.showinfo("No Node Selected", "Select a node in the list to edit it.")
+            return
+        self._edit_node(int(selection[0]))
+
+    def _edit_node(self, idx: int) -> None:
+        node = self._tree_dict["nodes"][idx]
         dialog = NodeEditDialog(self, node)
         self.wait_window(dialog)
         if dialog.result is not None:
             node["text"] = dialog.result
-            self._populate_node_list()
+            self._update_single_node_row(idx, node)
 
     # ------------------------------------------------------------------
     # Actions — Step 4
@@ -602,17 +931,54 @@ class BuilderUI(ctk.CTk):
         if not self._logo_path:
             return
         try:
-            img = Image.open(str(self._logo_path)).convert("RGBA")
-            img.thumbnail(_LOGO_THUMB_SIZE)
-            ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=_LOGO_THUMB_SIZE)
-            if self._logo_preview_label is None:
-                self._logo_preview_label = ctk.CTkLabel(
-                    self._logo_thumb_frame, image=ctk_img, text="")
-                self._logo_preview_label.pack(anchor="w", padx=5)
-            else:
-                self._logo_preview_label.configure(image=ctk_img)
-        except Exception:
-            pass
+            cache_key = (self._logo_path, self._logo_path.stat().st_mtime_ns)
+        except OSError:
+            return
+        photo = self._logo_cache.pop(cache_key, None)
+        if photo is not None:
+            self._logo_cache[cache_key] = photo  # Mark as most recently used
+            self._set_logo_preview(photo)
+            return
+        # Decoding a large photo can take a noticeable moment; do it on a
+        # worker and only build the Tk image back on the UI thread.
+        threading.Thread(target=self._decode_logo, args=(cache_key,), daemon=True).start()
+
+    def _decode_logo(self, cache_key: tuple[Path, int]) -> None:
+        try:
+            from PIL import Image
+
+            img = Image.open(str(cache_key[0]))
+            # JPEGs decode straight at a reduced DCT scale (no-op for others);
+            # asking for twice the preview size leaves bilinear enough pixels
+            # to look as good as LANCZOS at 80 px, for a fraction of the cost.
+            w, h = _LOGO_THUMB_SIZE
+            img.draft("RGB", (w * 2, h * 2))
+            img.thumbnail(_LOGO_THUMB_SIZE, Image.BILINEAR)
+            img = img.convert("RGBA")
+        except Exception:  # noqa: BLE001
+            return
+        self._post(self._on_logo_decoded, cache_key, img)
+
+    def _on_logo_decoded(self, cache_key: tuple[Path, int], img: Any) -> None:
+        from PIL import ImageTk
+
+        # A plain PhotoImage is enough for a fixed-size preview: no second
+        # PIL copy or DPI/appearance-change rescaling hooks.
+        photo = ImageTk.PhotoImage(img)
+        self._logo_cache[cache_key] = photo
+        while len(self._logo_cache) > _LOGO_CACHE_SIZE:
+            del self._logo_cache[next(iter(self._logo_cache))]
+        # Skip the preview if another logo was picked while this one decoded
+        if cache_key[0] == self._logo_path:
+            self._set_logo_preview(photo)
+
+    def _set_logo_preview(self, photo: ImageTk.PhotoImage) -> None:
+        if self._logo_preview_label is None:
+            self._logo_preview_label = ctk.CTkLabel(
+                self._logo_thumb_frame, image=photo, text="")
+            self._logo_preview_label.pack(anchor="w", padx=5)
+        else:
+            self._logo_preview_label.configure(image=photo)
 
     def _browse_output(self) -> None:
         dir_str = filedialog.askdirectory(title="Select Output Directory")
@@ -638,7 +1004,8 @@ class BuilderUI(ctk.CTk):
             messagebox.showwarning("No Output Directory", "Please select an output directory.")
             return
 
-        self._build_btn.configure(state="disabled")
+        cancel = self._build_cancel = threading.Event()
+        self._build_btn.configure(text="Cancel", command=self._cancel_build)
         self._build_progress.pack(pady=5)
         self._build_progress.configure(mode="indeterminate")
         self._build_progress.start()
@@ -646,49 +1013,92 @@ class BuilderUI(ctk.CTk):
 
         def _worker() -> None:
             try:
-                # Save tree.json to the output directory
-                tree_builder = TreeBuilder()
-                tree_json_path = tree_builder.save(
-                    self._tree_dict, self._output_dir / "tree.json"
-                )
+                from builder.tree_builder import TreeBuilder
 
-                def _progress(msg: str) -> None:
-                    self.after(0, lambda m=msg: self._build_status.configure(
-                        text=m, text_color="gray60"))
+                # Keep tree.json next to the .exe for the user; the bundle
+                # gets its own compact copy straight from the dict
+                TreeBuilder().save(self._tree_dict, self._output_dir / "tree.json")
 
-                packager = Packager()
-                exe_path = packager.build(
-                    tree_json_path=tree_json_path,
+                exe_path = self._packager.build(
+                    tree_dict=self._tree_dict,
                     logo_path=self._logo_path,
                     company_name=company_name,
                     output_dir=self._output_dir,
-                    progress_callback=_progress,
+                    progress_callback=functools.partial(
+                        self._post_status, self._build_status),
+                    cancel_event=cancel,
                 )
 
-                self.after(0, lambda: self._on_build_success(exe_path))
+                self._post(self._on_build_success, exe_path)
             except Exception as exc:
-                self.after(0, lambda: self._on_build_error(str(exc)))
+                if cancel.is_set():
+                    self._post(self._on_build_cancelled)
+                else:
+                    self._post(self._on_build_error, str(exc))
 
         threading.Thread(target=_worker, daemon=True).start()
 
-    def _on_build_success(self, exe_path: Path) -> None:
+    def _cancel_build(self) -> None:
+        # Packager.build checks the event between steps and kills PyInstaller
+        # if it is running; the worker then reports back.  A build that has
+        # already placed its exe reports success instead.
+        self._build_cancel.set()
+        self._build_btn.configure(state="disabled")
+        self._build_status.configure(text="Cancelling…", text_color="gray60")
+
+    def _reset_build_controls(self) -> None:
         self._build_progress.stop()
         self._build_progress.pack_forget()
+        self._build_btn.configure(text="Build .exe", command=self._run_build, state="normal")
+
+    def _on_build_success(self, exe_path: Path) -> None:
+        self._reset_build_controls()
         self._build_status.configure(
             text=f"✓ Build complete!\n{exe_path}", text_color="#4CAF50")
-        self._build_btn.configure(state="normal")
 
     def _on_build_error(self, error_msg: str) -> None:
-        self._build_progress.stop()
-        self._build_progress.pack_forget()
+        self._reset_build_controls()
         self._build_status.configure(
             text=f"✗ Build failed: {error_msg}", text_color="#F44336")
-        self._build_btn.configure(state="normal")
+
+    def _on_build_cancelled(self) -> None:
+        self._reset_build_controls()
+        self._build_status.configure(text="Build cancelled.", text_color="gray60")
 
     # ==================================================================
     # BULK LIBRARY MODE — Step builders
     # ==================================================================
 
+    # ------------------------------------------------------------------
+    # Shared bulk step widgets
+    # ------------------------------------------------------------------
+
+    def _add_step_header(self, frame: ctk.CTkScrollableFrame, title: str,
+                         description: str) -> None:
+        ctk.CTkLabel(frame, text=title,
+                     font=self._font_heading).pack(pady=(10, 4), anchor="w")
+        ctk.CTkLabel(frame, text=description, text_color="gray60", wraplength=620,
+                     justify="left").pack(anchor="w", pady=(0, 16))
+
+    def _add_bulk_nav_row(self, frame: ctk.CTkScrollableFrame, back: int, next_: int) -> None:
+        nav_row = ctk.CTkFrame(frame, fg_color="transparent")
+        nav_row.pack(pady=(10, 0))
+        ctk.CTkButton(nav_row, text="← Back", fg_color="gray40",
+                      command=lambda: self._goto_bulk_step(back)).pack(side="left", padx=5)
+        ctk.CTkButton(nav_row, text="Next →",
+                      command=lambda: self._goto_bulk_step(next_)).pack(side="left", padx=5)
+
+    def _add_bulk_progress_widgets(
+        self, frame: ctk.CTkScrollableFrame
+    ) -> tuple[ctk.CTkProgressBar, ctk.CTkLabel, ctk.CTkTextbox]:
+        """Progress bar (packed on demand), status label and scrollable log."""
+        progress = ctk.CTkProgressBar(frame)
+        status = ctk.CTkLabel(frame, text="", wraplength=620, justify="left")
+        status.pack(pady=4)
+        log = ctk.CTkTextbox(frame, height=200, state="disabled")
+        log.pack(fill="x", pady=8)
+        return progress, status, log
+
     # ------------------------------------------------------------------
     # Bulk Step 1 — Select Knowledge Base Folder
     # ------------------------------------------------------------------
@@ -697,30 +1107,27 @@ class BuilderUI(ctk.CTk):
         frame = self._make_step_frame()
         self._bulk_frames[1] = frame
 
-        ctk.CTkLabel(frame, text="Select Knowledge Base Folder",
-                     font=ctk.CTkFont(size=22, weight="bold")).pack(pady=(10, 4), anchor="w")
-        ctk.CTkLabel(
+        self._add_step_header(
             frame,
-            text=(
-                "Choose the root folder containing your DOCX documentation.\n"
-                "GuidWire will recursively scan all sub-folders and preserve the"
-                " folder structure in the output content package."
-            ),
-            text_color="gray60", wraplength=620, justify="left",
-        ).pack(anchor="w", pady=(0, 16))
+            "Select Knowledge Base Folder",
+            "Choose the root folder containing your DOCX documentation.\n"
+            "GuidWire will recursively scan all sub-folders and preserve the"
+            " folder structure in the output content package.",
+        )
 
-        ctk.CTkButton(frame, text="Browse Folder…",
-                      command=self._bulk_browse_folder).pack(anchor="w", pady=4)
+        self._bulk_browse_btn = ctk.CTkButton(frame, text="Browse Folder…",
+                                              command=self._bulk_browse_folder)
+        self._bulk_browse_btn.pack(anchor="w", pady=4)
 
         self._bulk_folder_label = ctk.CTkLabel(
             frame, text="No folder selected", text_color="gray50",
-            font=ctk.CTkFont(size=12),
+            font=self._font_body,
         )
         self._bulk_folder_label.pack(anchor="w", pady=4)
 
         # Scan result
         self._bulk_scan_label = ctk.CTkLabel(frame, text="", text_color="gray60",
-                                             font=ctk.CTkFont(size=12))
+                                             font=self._font_body)
         self._bulk_scan_label.pack(anchor="w", pady=4)
 
         # Output base folder
@@ -744,38 +1151,24 @@ class BuilderUI(ctk.CTk):
         frame = self._make_step_frame()
         self._bulk_frames[2] = frame
 
-        ctk.CTkLabel(frame, text="Ingest & Index",
-                     font=ctk.CTkFont(size=22, weight="bold")).pack(pady=(10, 4), anchor="w")
-        ctk.CTkLabel(
+        self._add_step_header(
             frame,
-            text=(
-                "GuidWire will copy each DOCX file into the content folder (preserving"
-                " the source folder tree), extract its text, and build a manifest.\n"
-                "Unchanged files are skipped on subsequent runs."
-            ),
-            text_color="gray60", wraplength=620, justify="left",
-        ).pack(anchor="w", pady=(0, 16))
+            "Ingest & Index",
+            "GuidWire will copy each DOCX file into the content folder (preserving"
+            " the source folder tree), extract its text, and build a manifest.\n"
+            "Unchanged files are skipped on subsequent runs.",
+        )
 
         self._bulk_ingest_btn = ctk.CTkButton(
             frame, text="Start Ingest", command=self._run_bulk_ingest,
         )
         self._bulk_ingest_btn.pack(pady=8)
 
-        self._bulk_ingest_progress = ctk.CTkProgressBar(frame)
-        self._bulk_ingest_status = ctk.CTkLabel(frame, text="", wraplength=620,
-                                                justify="left")
-        self._bulk_ingest_status.pack(pady=4)
+        (self._bulk_ingest_progress, self._bulk_ingest_status,
+         self._bulk_ingest_log) = self._add_bulk_progress_widgets(frame)
+        self._update_bulk_controls()
 
-        # Scrollable log
-        self._bulk_ingest_log = ctk.CTkTextbox(frame, height=200, state="disabled")
-        self._bulk_ingest_log.pack(fill="x", pady=8)
-
-        nav_row = ctk.CTkFrame(frame, fg_color="transparent")
-        nav_row.pack(pady=(10, 0))
-        ctk.CTkButton(nav_row, text="← Back", fg_color="gray40",
-                      command=lambda: self._goto_bulk_step(1)).pack(side="left", padx=5)
-        ctk.CTkButton(nav_row, text="Next →",
-                      command=lambda: self._goto_bulk_step(3)).pack(side="left", padx=5)
+        self._add_bulk_nav_row(frame, back=1, next_=3)
 
     # ------------------------------------------------------------------
     # Bulk Step 3 — Generate Tree Library
@@ -785,17 +1178,15 @@ class BuilderUI(ctk.CTk):
         frame = self._make_step_frame()
         self._bulk_frames[3] = frame
 
-        ctk.CTkLabel(frame, text="Generate Tree Library",
-                     font=ctk.CTkFont(size=22, weight="bold")).pack(pady=(10, 4), anchor="w")
-        ctk.CTkLabel(
+        self._add_step_header(
             frame,
-            text=(
-                "Enter your Google Gemini API key.  GuidWire will group documents by"
-                " top-level folder (category), generate a decision tree per document,"
-                " and write library.json."
-            ),
-            text_color="gray60", wraplength=620, justify="left",
-        ).pack(anchor="w", pady=(0, 16))
+            "Generate Tree Library",
+            "Enter your Google Gemini API key.  GuidWire will group documents by"
+            " top-level folder (category), generate a decision tree per document,"
+            " and write library.json.\n"
+            "Ingest & Generate runs Step 2 as well, analyzing each document as"
+            " soon as its text has been extracted.",
+        )
 
         api_row = ctk.CTkFrame(frame, fg_color="transparent")
         api_row.pack(fill="x", pady=5)
@@ -803,31 +1194,31 @@ class BuilderUI(ctk.CTk):
         self._bulk_api_key_entry = ctk.CTkEntry(api_row, show="•", width=340,
                                                 placeholder_text="AIza…")
         self._bulk_api_key_entry.pack(side="left", padx=5)
+        if self._last_api_key:
+            # Carry over the key already used in single-document mode
+            self._bulk_api_key_entry.insert(0, self._last_api_key)
         self._bulk_show_key_btn = ctk.CTkButton(
             api_row, text="Show", width=60,
             command=self._bulk_toggle_api_key,
         )
         self._bulk_show_key_btn.pack(side="left")
 
+        gen_row = ctk.CTkFrame(frame, fg_color="transparent")
+        gen_row.pack(pady=10)
         self._bulk_gen_btn = ctk.CTkButton(
-            frame, text="Generate Trees", command=self._run_bulk_generate,
+            gen_row, text="Generate Trees", command=self._run_bulk_generate,
+        )
+        self._bulk_gen_btn.pack(side="left", padx=5)
+        self._bulk_ingest_gen_btn = ctk.CTkButton(
+            gen_row, text="Ingest & Generate", command=self._run_bulk_ingest_generate,
         )
-        self._bulk_gen_btn.pack(pady=10)
+        self._bulk_ingest_gen_btn.pack(side="left", padx=5)
 
-        self._bulk_gen_progress = ctk.CTkProgressBar(frame)
-        self._bulk_gen_status = ctk.CTkLabel(frame, text="", wraplength=620,
-                                             justify="left")
-        self._bulk_gen_status.pack(pady=4)
+        (self._bulk_gen_progress, self._bulk_gen_status,
+         self._bulk_gen_log) = self._add_bulk_progress_widgets(frame)
+        self._update_bulk_controls()
 
-        self._bulk_gen_log = ctk.CTkTextbox(frame, height=200, state="disabled")
-        self._bulk_gen_log.pack(fill="x", pady=8)
-
-        nav_row = ctk.CTkFrame(frame, fg_color="transparent")
-        nav_row.pack(pady=(10, 0))
-        ctk.CTkButton(nav_row, text="← Back", fg_color="gray40",
-                      command=lambda: self._goto_bulk_step(2)).pack(side="left", padx=5)
-        ctk.CTkButton(nav_row, text="Next →",
-                      command=lambda: self._goto_bulk_step(4)).pack(side="left", padx=5)
+        self._add_bulk_nav_row(frame, back=2, next_=4)
 
     # ------------------------------------------------------------------
     # Bulk Step 4 — Export Offline Package
@@ -837,17 +1228,13 @@ class BuilderUI(ctk.CTk):
         frame = self._make_step_frame()
         self._bulk_frames[4] = frame
 
-        ctk.CTkLabel(frame, text="Export Offline Package",
-                     font=ctk.CTkFont(size=22, weight="bold")).pack(pady=(10, 4), anchor="w")
-        ctk.CTkLabel(
+        self._add_step_header(
             frame,
-            text=(
-                "Build the standalone offline library viewer executable.\n"
-                "Place the generated EXE together with the content folder"
-                " (created in Step 2) on the analyst's machine — no Python required."
-            ),
-            text_color="gray60", wraplength=620, justify="left",
-        ).pack(anchor="w", pady=(0, 16))
+            "Export Offline Package",
+            "Build the standalone offline library viewer executable.\n"
+            "Place the generated EXE together with the content folder"
+            " (created in Step 2) on the analyst's machine — no Python required.",
+        )
 
         # Company name
         name_row = ctk.CTkFrame(frame, fg_color="transparent")
@@ -869,14 +1256,13 @@ class BuilderUI(ctk.CTk):
         self._bulk_build_btn = ctk.CTkButton(
             frame, text="Build Library Viewer .exe",
             command=self._run_bulk_build, height=40,
-            font=ctk.CTkFont(size=15, weight="bold"),
+            font=self._font_action,
         )
         self._bulk_build_btn.pack(pady=15)
 
-        self._bulk_build_progress = ctk.CTkProgressBar(frame)
-        self._bulk_build_status = ctk.CTkLabel(frame, text="", wraplength=620,
-                                               justify="left")
-        self._bulk_build_status.pack(pady=5)
+        # PyInstaller's output streams into the log while the EXE builds
+        (self._bulk_build_progress, self._bulk_build_status,
+         self._bulk_build_log) = self._add_bulk_progress_widgets(frame)
 
         ctk.CTkButton(frame, text="← Back", fg_color="gray40",
                       command=lambda: self._goto_bulk_step(3)).pack(pady=(10, 0))
@@ -897,11 +1283,34 @@ class BuilderUI(ctk.CTk):
         self._bulk_folder_label.configure(
             text=str(self._bulk_source_root), text_color="white"
         )
-        # Scan immediately to show file count / size
-        ingestor = BulkIngestor()
-        files = ingestor.scan(self._bulk_source_root)
-        total_size = sum(f["size"] for f in files)
-        size_mb = total_size / (1024 * 1024)
+        # Scan in the background to show file count / size; a newer
+        # selection bumps the token so a slower, stale scan is ignored.
+        self._scan_token += 1
+        token = self._scan_token
+        root = self._bulk_source_root
+        self._bulk_scan_label.configure(text="Scanning…", text_color="gray60")
+        self._bulk_file_count = None
+
+        def _scan_worker() -> None:
+            try:
+                files = self._bulk_ingestor.scan(root)
+            except OSError as exc:
+                self._post(self._on_bulk_scan_done, token, None, str(exc))
+                return
+            self._post(self._on_bulk_scan_done, token, files, None)
+
+        threading.Thread(target=_scan_worker, daemon=True).start()
+
+    def _on_bulk_scan_done(self, token: int, files: list[dict[str, Any]] | None,
+                           error_msg: str | None) -> None:
+        if token != self._scan_token:
+            return
+        if files is None:
+            self._bulk_scan_label.configure(
+                text=f"✗ Scan failed: {error_msg}", text_color="#F44336")
+            return
+        self._bulk_file_count = len(files)
+        size_mb = sum(f["size"] for f in files) / (1024 * 1024)
         self._bulk_scan_label.configure(
             text=f"Found {len(files)} DOCX file(s)  |  Total size: {size_mb:.1f} MB",
             text_color="#4CAF50" if files else "orange",
@@ -919,12 +1328,81 @@ class BuilderUI(ctk.CTk):
     # Bulk Step 2 actions
     # ------------------------------------------------------------------
 
-    def _bulk_log(self, textbox: ctk.CTkTextbox, msg: str) -> None:
+    def _bulk_log_many(self, textbox: ctk.CTkTextbox, msgs: list[str]) -> None:
+        """Append *msgs* with a single state toggle and insert.
+
+        A message may span several lines (e.g. a PyInstaller error tail), so
+        lines are counted from the inserted text rather than per message.
+        """
+        msgs = msgs[-_MAX_LOG_LINES:]  # Older lines would be trimmed right away
+        text = "\n".join(msgs)
         textbox.configure(state="normal")
-        textbox.insert("end", msg + "\n")
+        textbox.insert("end", text + "\n")
+        count = self._log_line_count.get(textbox, 0) + text.count("\n") + 1
+        excess = count - _MAX_LOG_LINES
+        if excess > 0:
+            textbox.delete("1.0", f"{excess + 1}.0")
+            count = _MAX_LOG_LINES
+        self._log_line_count[textbox] = count
         textbox.see("end")
         textbox.configure(state="disabled")
 
+    def _on_progress(self, status: ctk.CTkLabel, textbox: ctk.CTkTextbox,
+                     bar: ctk.CTkProgressBar | None, msg: str, current: int,
+                     total: int) -> None:
+        """Bulk ``progress_callback`` target; runs on the worker thread.
+
+        With *bar* None the line is logged without moving any progress bar.
+        """
+        self._log_queue.append(
+            (status, textbox, bar, f"[{current}/{total}] {msg}", current / max(total, 1)))
+
+    def _on_build_output(self, status: ctk.CTkLabel, textbox: ctk.CTkTextbox,
+                         msg: str) -> None:
+        """Packager ``progress_callback`` target; runs on the worker thread."""
+        self._log_queue.append((status, textbox, None, msg, 0.0))
+
+    def _flush_log(self) -> None:
+        """Apply queued bulk progress lines in one go.
+
+        Only the newest line and fraction per status label / progress bar
+        are shown, and each log textbox gets a single insert for everything
+        queued since the last tick.
+        """
+        statuses: dict[ctk.CTkLabel, str] = {}
+        logs: dict[ctk.CTkTextbox, list[str]] = {}
+        bars: dict[ctk.CTkProgressBar, float] = {}
+        while self._log_queue:
+            status, textbox, bar, line, fraction = self._log_queue.popleft()
+            statuses[status] = line
+            logs.setdefault(textbox, []).append(line)
+            if bar is not None:
+                bars[bar] = fraction
+        for status, line in statuses.items():
+            status.configure(text=line)
+        for bar, fraction in bars.items():
+            bar.set(fraction)
+        for textbox, lines in logs.items():
+            self._bulk_log_many(textbox, lines)
+
+    def _update_bulk_controls(self) -> None:
+        """Enable only the bulk actions that cannot clash with a running job.
+
+        An ingest (Start Ingest, or Ingest & Generate) blocks every other
+        ingest and folder rescan; a generate blocks every other generate.
+        Steps built later pick the current state up from their builders.
+        """
+        ingest_state = "disabled" if self._bulk_ingest_busy else "normal"
+        self._bulk_browse_btn.configure(state=ingest_state)
+        if 2 in self._bulk_frames:
+            self._bulk_ingest_btn.configure(state=ingest_state)
+        if 3 in self._bulk_frames:
+            self._bulk_gen_btn.configure(
+                state="disabled" if self._bulk_gen_busy else "normal")
+            self._bulk_ingest_gen_btn.configure(
+                state="disabled" if self._bulk_ingest_busy or self._bulk_gen_busy
+                else "normal")
+
     def _run_bulk_ingest(self) -> None:
         if not self._bulk_source_root:
             messagebox.showwarning("No Folder", "Please select a source folder in Step 1.")
@@ -934,54 +1412,51 @@ class BuilderUI(ctk.CTk):
                                    "Please select an output base folder in Step 1.")
             return
 
-        self._bulk_ingest_btn.configure(state="disabled")
+        self._bulk_ingest_busy = True
+        self._update_bulk_controls()
         self._bulk_ingest_progress.pack(pady=5)
-        self._bulk_ingest_progress.configure(mode="indeterminate")
-        self._bulk_ingest_progress.start()
+        self._bulk_ingest_progress.configure(mode="determinate")
+        self._bulk_ingest_progress.set(0)
         self._bulk_ingest_status.configure(text="Ingesting…", text_color="gray60")
 
         # Derive content folder name from output_base name
         content_dir = self._bulk_output_base
         manifest_path = content_dir / "manifest.json"
 
-        def _cb(msg: str, current: int, total: int) -> None:
-            self.after(0, lambda m=msg, c=current, t=total: (
-                self._bulk_ingest_status.configure(text=f"[{c}/{t}] {m}"),
-                self._bulk_log(self._bulk_ingest_log, f"[{c}/{t}] {m}"),
-            ))
-
         def _worker() -> None:
             try:
-                ingestor = BulkIngestor()
-                manifest = ingestor.ingest(
+                manifest = self._bulk_ingestor.ingest(
                     root=self._bulk_source_root,
                     output_base=content_dir,
                     manifest_path=manifest_path,
-                    progress_callback=_cb,
+                    progress_callback=functools.partial(
+                        self._on_progress, self._bulk_ingest_status,
+                        self._bulk_ingest_log, self._bulk_ingest_progress),
                 )
                 self._bulk_manifest = manifest
-                self.after(0, self._on_bulk_ingest_success)
+                self._post(self._on_bulk_ingest_success)
             except Exception as exc:  # noqa: BLE001
-                self.after(0, lambda e=str(exc): self._on_bulk_ingest_error(e))
+                self._post(self._on_bulk_ingest_error, str(exc))
 
         threading.Thread(target=_worker, daemon=True).start()
 
     def _on_bulk_ingest_success(self) -> None:
-        self._bulk_ingest_progress.stop()
+        self._bulk_ingest_progress.set(1.0)
         self._bulk_ingest_progress.pack_forget()
         count = len(self._bulk_manifest or {})
         self._bulk_ingest_status.configure(
             text=f"✓ Ingest complete — {count} file(s) indexed.", text_color="#4CAF50"
         )
-        self._bulk_ingest_btn.configure(state="normal")
+        self._bulk_ingest_busy = False
+        self._update_bulk_controls()
 
     def _on_bulk_ingest_error(self, error_msg: str) -> None:
-        self._bulk_ingest_progress.stop()
         self._bulk_ingest_progress.pack_forget()
         self._bulk_ingest_status.configure(
             text=f"✗ Error: {error_msg}", text_color="#F44336"
         )
-        self._bulk_ingest_btn.configure(state="normal")
+        self._bulk_ingest_busy = False
+        self._update_bulk_controls()
 
     # ------------------------------------------------------------------
     # Bulk Step 3 actions
@@ -1002,60 +1477,125 @@ class BuilderUI(ctk.CTk):
                                    "Please run Ingest & Index (Step 2) first.")
             return
         api_key = self._bulk_api_key_entry.get().strip()
-        if not api_key:
-            messagebox.showwarning("No API Key", "Please enter your Google Gemini API key.")
+        if not self._check_api_key(api_key):
             return
         if not self._bulk_output_base:
             messagebox.showwarning("No Output Folder",
                                    "Please select an output base folder in Step 1.")
             return
 
-        self._bulk_gen_btn.configure(state="disabled")
+        self._bulk_gen_busy = True
+        self._update_bulk_controls()
         self._bulk_gen_progress.pack(pady=5)
-        self._bulk_gen_progress.configure(mode="indeterminate")
-        self._bulk_gen_progress.start()
+        self._bulk_gen_progress.configure(mode="determinate")
+        self._bulk_gen_progress.set(0)
         self._bulk_gen_status.configure(text="Generating…", text_color="gray60")
 
         content_dir = self._bulk_output_base
 
-        def _cb(msg: str, current: int, total: int) -> None:
-            self.after(0, lambda m=msg, c=current, t=total: (
-                self._bulk_gen_status.configure(text=f"[{c}/{t}] {m}"),
-                self._bulk_log(self._bulk_gen_log, f"[{c}/{t}] {m}"),
-            ))
-
         def _worker() -> None:
             try:
-                builder = LibraryBuilder()
-                library_path = builder.build(
+                library_path = self._library_builder.build(
                     manifest=self._bulk_manifest,
                     output_base=content_dir,
                     api_key=api_key,
-                    progress_callback=_cb,
+                    progress_callback=functools.partial(
+                        self._on_progress, self._bulk_gen_status,
+                        self._bulk_gen_log, self._bulk_gen_progress),
+                )
+                self._bulk_library_path = library_path
+                self._last_api_key = api_key
+                self._post(self._on_bulk_generate_success)
+            except Exception as exc:  # noqa: BLE001
+                self._post(self._on_bulk_generate_error, str(exc))
+
+        threading.Thread(target=_worker, daemon=True).start()
+
+    def _run_bulk_ingest_generate(self) -> None:
+        """Ingest and generate in one pass: trees for the first documents are
+        requested while later ones are still being extracted."""
+        if not self._bulk_source_root:
+            messagebox.showwarning("No Folder", "Please select a source folder in Step 1.")
+            return
+        api_key = self._bulk_api_key_entry.get().strip()
+        if not self._check_api_key(api_key):
+            return
+        if not self._bulk_output_base:
+            messagebox.showwarning("No Output Folder",
+                                   "Please select an output base folder in Step 1.")
+            return
+
+        self._bulk_ingest_busy = self._bulk_gen_busy = True
+        self._update_bulk_controls()
+        self._bulk_gen_progress.pack(pady=5)
+        self._bulk_gen_progress.configure(mode="determinate")
+        self._bulk_gen_progress.set(0)
+        self._bulk_gen_status.configure(text="Ingesting & generating…", text_color="gray60")
+
+        root = self._bulk_source_root
+        content_dir = self._bulk_output_base
+        total = self._bulk_file_count
+
+        def _worker() -> None:
+            manifest: dict[str, Any] = {}
+
+            def _docs() -> Iterator[tuple[str, dict[str, Any]]]:
+                for rel_str, record in self._bulk_ingestor.iter_ingest(
+                    root=root,
+                    output_base=content_dir,
+                    manifest_path=content_dir / "manifest.json",
+                    # Ingest lines share the log; only generation moves the bar
+                    progress_callback=functools.partial(
+                        self._on_progress, self._bulk_gen_status,
+                        self._bulk_gen_log, None),
+                ):
+                    manifest[rel_str] = record
+                    yield rel_str, record
+
+            try:
+                library_path = self._library_builder.build_streaming(
+                    _docs(),
+                    output_base=content_dir,
+                    api_key=api_key,
+                    progress_callback=functools.partial(
+                        self._on_progress, self._bulk_gen_status,
+                        self._bulk_gen_log, self._bulk_gen_progress),
+                    total=total,
                 )
+                self._bulk_manifest = manifest
                 self._bulk_library_path = library_path
-                self.after(0, self._on_bulk_generate_success)
+                self._last_api_key = api_key
+                self._post(self._on_bulk_ingest_generate_success)
             except Exception as exc:  # noqa: BLE001
-                self.after(0, lambda e=str(exc): self._on_bulk_generate_error(e))
+                self._post(self._on_bulk_ingest_generate_error, str(exc))
 
         threading.Thread(target=_worker, daemon=True).start()
 
+    def _on_bulk_ingest_generate_success(self) -> None:
+        self._bulk_ingest_busy = False
+        self._on_bulk_generate_success()
+
+    def _on_bulk_ingest_generate_error(self, error_msg: str) -> None:
+        self._bulk_ingest_busy = False
+        self._on_bulk_generate_error(error_msg)
+
     def _on_bulk_generate_success(self) -> None:
-        self._bulk_gen_progress.stop()
+        self._bulk_gen_progress.set(1.0)
         self._bulk_gen_progress.pack_forget()
         self._bulk_gen_status.configure(
             text=f"✓ Library generated → {self._bulk_library_path}",
             text_color="#4CAF50",
         )
-        self._bulk_gen_btn.configure(state="normal")
+        self._bulk_gen_busy = False
+        self._update_bulk_controls()
 
     def _on_bulk_generate_error(self, error_msg: str) -> None:
-        self._bulk_gen_progress.stop()
         self._bulk_gen_progress.pack_forget()
         self._bulk_gen_status.configure(
             text=f"✗ Error: {error_msg}", text_color="#F44336"
         )
-        self._bulk_gen_btn.configure(state="normal")
+        self._bulk_gen_busy = False
+        self._update_bulk_controls()
 
     # ------------------------------------------------------------------
     # Bulk Step 4 actions
@@ -1096,23 +1636,19 @@ class BuilderUI(ctk.CTk):
         content_dir = self._bulk_output_base
         exe_out = self._bulk_exe_output_dir
 
-        def _progress(msg: str) -> None:
-            self.after(0, lambda m=msg: self._bulk_build_status.configure(
-                text=m, text_color="gray60"
-            ))
-
         def _worker() -> None:
             try:
-                packager = Packager()
-                exe_path = packager.build_library_viewer(
+                exe_path = self._packager.build_library_viewer(
                     content_dir=content_dir,
                     company_name=company_name,
                     output_dir=exe_out,
-                    progress_callback=_progress,
+                    progress_callback=functools.partial(
+                        self._on_build_output, self._bulk_build_status,
+                        self._bulk_build_log),
                 )
-                self.after(0, lambda: self._on_bulk_build_success(exe_path))
+                self._post(self._on_bulk_build_success, exe_path)
             except Exception as exc:  # noqa: BLE001
-                self.after(0, lambda e=str(exc): self._on_bulk_build_error(e))
+                self._post(self._on_bulk_build_error, str(exc))
 
         threading.Thread(target=_worker, daemon=True).start()
 
@@ -8,12 +8,31 @@ source-document launching.
 
 from __future__ import annotations
 
-import json
+import functools
+import re
 import subprocess
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    import json
+
+    _loads = json.loads
+
+# Parsed trees kept in memory, so re-opening an entry skips the disk read
+_TREE_CACHE_SIZE = 32
+
+# Tree loads and searches run here rather than on the Tk thread, which would
+# freeze the window on a slow disk or a large library.  Threads start on
+# first use.
+_IO_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="library-io")
+
 
 def _locate_content_dir(content_folder_name: str) -> Path:
     """Return the content directory, supporting both frozen-exe and source runs.
@@ -27,6 +46,13 @@ def _locate_content_dir(content_folder_name: str) -> Path:
     return Path(__file__).parent.parent / content_folder_name
 
 
+@functools.lru_cache(maxsize=_TREE_CACHE_SIZE)
+def _load_tree_file(tree_path: Path, mtime_ns: int) -> dict[str, Any]:
+    """Parse *tree_path*; *mtime_ns* is part of the cache key so an edited
+    file is re-read."""
+    return _loads(tree_path.read_bytes())
+
+
 class LibraryEngine:
     """Loads and navigates a GuidWire tree library."""
 
@@ -48,11 +74,27 @@ class LibraryEngine:
                 "Make sure the content folder is placed next to the viewer executable."
             )
 
-        with library_path.open(encoding="utf-8") as fh:
-            data = json.load(fh)
+        data = _loads(library_path.read_bytes())
 
         self._entries: list[dict[str, Any]] = data.get("entries", [])
 
+        # Indexes built once here so browsing and searching never rescan or
+        # re-lowercase the whole library
+        self._by_category: dict[str, list[dict[str, Any]]] = {}
+        for entry in self._entries:
+            self._by_category.setdefault(
+                entry.get("category", "Uncategorized"), []
+            ).append(entry)
+        self._categories: list[str] = sorted(self._by_category)
+        # Case-folded title, description and symptoms as UTF-8, aligned with
+        # _entries; substring tests on bytes run as a plain C memory search
+        self._search_blob: list[bytes] = [
+            "\n".join(
+                [e.get("title", ""), e.get("description", ""), *e.get("symptoms", [])]
+            ).casefold().encode("utf-8", "ignore")
+            for e in self._entries
+        ]
+
     # ------------------------------------------------------------------
     # Public properties / helpers
     # ------------------------------------------------------------------
@@ -68,43 +110,71 @@ class LibraryEngine:
 
     def get_categories(self) -> list[str]:
         """Return a sorted list of unique category names."""
-        return sorted({e.get("category", "Uncategorized") for e in self._entries})
+        return list(self._categories)
 
     def get_entries_for_category(self, category: str) -> list[dict[str, Any]]:
         """Return all entries whose category matches *category*."""
-        return [e for e in self._entries if e.get("category") == category]
+        return list(self._by_category.get(category, ()))
 
     def search(self, query: str) -> list[dict[str, Any]]:
         """Search entries by title, description, or symptoms (case-insensitive).
 
+        Every whitespace-separated word in *query* must appear somewhere in
+        the entry, in any order and in any of the searched fields.
+
         Args:
             query: Keyword(s) to search for.
 
         Returns:
             Matching entries; empty list when *query* is blank.
         """
-        if not query.strip():
+        terms = [t.encode("utf-8", "ignore") for t in query.casefold().split()]
+        if not terms:
             return []
-        q = query.lower()
+        if len(terms) == 1:
+            term = terms[0]
+            return [
+                entry
+                for entry, blob in zip(self._entries, self._search_blob)
+                if term in blob
+            ]
+        # One lookahead per term keeps the AND test inside the regex engine
+        # rather than a Python-level loop over terms for every entry
+        matcher = re.compile(
+            b"".join(b"(?=.*?" + re.escape(t) + b")" for t in terms), re.DOTALL
+        ).match
         return [
-            e
-            for e in self._entries
-            if q in e.get("title", "").lower()
-            or q in e.get("description", "").lower()
-            or any(q in s.lower() for s in e.get("symptoms", []))
+            entry
+            for entry, blob in zip(self._entries, self._search_blob)
+            if matcher(blob)
         ]
 
+    def search_async(self, query: str) -> Future[list[dict[str, Any]]]:
+        """Like :meth:`search`, but runs on a background thread."""
+        return _IO_POOL.submit(self.search, query)
+
     def load_tree(self, entry: dict[str, Any]) -> dict[str, Any]:
         """Load and return the decision-tree dict for *entry*.
 
+        The returned dict is cached and shared between calls; treat it as
+        read-only.
+
         Raises:
             FileNotFoundError: If the tree JSON file is missing.
         """
         tree_path = self._content_dir / entry["tree_file"]
-        if not tree_path.exists():
-            raise FileNotFoundError(f"Tree file not found: {tree_path}")
-        with tree_path.open(encoding="utf-8") as fh:
-            return json.load(fh)
+        try:
+            mtime_ns = tree_path.stat().st_mtime_ns
+        except OSError:
+            raise FileNotFoundError(f"Tree file not found: {tree_path}") from None
+        return _load_tree_file(tree_path, mtime_ns)
+
+    def load_tree_async(self, entry: dict[str, Any]) -> Future[dict[str, Any]]:
+        """Like :meth:`load_tree`, but runs on a background thread.
+
+        The returned future raises whatever :meth:`load_tree` would.
+        """
+        return _IO_POOL.submit(self.load_tree, entry)
 
     def open_source_doc(self, entry: dict[str, Any]) -> None:
         """Open the source DOCX in the default system application (e.g. Word).
@@ -121,7 +191,22 @@ class LibraryEngine:
             import os
 
             os.startfile(str(doc_path))  # type: ignore[attr-defined]
-        elif sys.platform == "darwin":
-            subprocess.Popen(["open", str(doc_path)])  # noqa: S603, S607
-        else:
-            subprocess.Popen(["xdg-open", str(doc_path)])  # noqa: S603, S607
+            return
+
+        opener = "open" if sys.platform == "darwin" else "xdg-open"
+        # Fully detached: no inherited stdio or descriptors, and its own
+        # session, so a slow-starting office suite is not tied to the viewer
+        subprocess.Popen(  # noqa: S603
+            [opener, str(doc_path)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+    def open_source_doc_async(self, entry: dict[str, Any]) -> Future[None]:
+        """Like :meth:`open_source_doc`, but runs on a background thread.
+
+        ``os.startfile`` can block while shell extensions inspect the file.
+        """
+        return _IO_POOL.submit(self.open_source_doc, entry)
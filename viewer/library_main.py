@@ -8,15 +8,21 @@ its name is read from ``viewer_config.json`` in the same directory.
 
 from __future__ import annotations
 
-import json
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    import json
+
+    _loads = json.loads
+
 # Allow running from source (not just as a frozen bundle)
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import customtkinter as ctk
-
 
 def _read_content_folder_name() -> str:
     """Read the content folder name from ``viewer_config.json``."""
@@ -27,13 +33,36 @@ def _read_content_folder_name() -> str:
 
     if cfg_path.exists():
         try:
-            with cfg_path.open(encoding="utf-8") as fh:
-                return json.load(fh).get("content_folder", "GuidWire_Content")
+            return _loads(cfg_path.read_bytes()).get("content_folder", "GuidWire_Content")
         except Exception:  # noqa: BLE001
             pass
     return "GuidWire_Content"
 
 
+def _show_error(text: str, geometry: str) -> None:
+    """Show *text* in a standalone error window and block until it is closed.
+
+    customtkinter is imported here so that failing before the library UI is
+    loaded does not first pay for importing it (and PIL) in full.
+    """
+    import customtkinter as ctk
+
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("dark-blue")
+    root = ctk.CTk()
+    root.title("GuidWire Library Viewer — Error")
+    root.geometry(geometry)
+    width = int(geometry.split("x", 1)[0])
+    ctk.CTkLabel(
+        root,
+        text=text,
+        wraplength=width - 40,
+        text_color="#F44336",
+        font=ctk.CTkFont(size=13),
+    ).pack(expand=True, padx=20, pady=20)
+    root.mainloop()
+
+
 def main() -> None:
     content_folder_name = _read_content_folder_name()
 
@@ -42,45 +71,34 @@ def main() -> None:
     else:
         content_dir = Path(__file__).parent.parent / content_folder_name
 
+    # The library is opened before the UI module is imported, so a missing
+    # content folder (the common failure) reaches its error screen quickly.
     try:
         from viewer.library_engine import LibraryEngine
-        from viewer.ui.library_viewer_ui import LibraryViewerUI
+
+        engine = LibraryEngine(content_dir)
     except ImportError as exc:
-        ctk.set_appearance_mode("dark")
-        ctk.set_default_color_theme("dark-blue")
-        root = ctk.CTk()
-        root.title("GuidWire Library Viewer — Error")
-        root.geometry("520x200")
-        ctk.CTkLabel(
-            root,
-            text=f"Missing dependency — cannot start GuidWire Library Viewer:\n{exc}",
-            wraplength=480,
-            text_color="#F44336",
-            font=ctk.CTkFont(size=13),
-        ).pack(expand=True, padx=20, pady=20)
-        root.mainloop()
+        _show_error(
+            f"Missing dependency — cannot start GuidWire Library Viewer:\n{exc}",
+            "520x200",
+        )
+        return
+    except FileNotFoundError:
+        _show_error(
+            f"Content folder not found.\n\n"
+            f"Expected: {content_dir}\n\n"
+            f"Place the '{content_folder_name}' folder next to this executable.",
+            "600x220",
+        )
         return
 
     try:
-        engine = LibraryEngine(content_dir)
-    except FileNotFoundError as exc:
-        ctk.set_appearance_mode("dark")
-        ctk.set_default_color_theme("dark-blue")
-        root = ctk.CTk()
-        root.title("GuidWire Library Viewer — Error")
-        root.geometry("600x220")
-        ctk.CTkLabel(
-            root,
-            text=(
-                f"Content folder not found.\n\n"
-                f"Expected: {content_dir}\n\n"
-                f"Place the '{content_folder_name}' folder next to this executable."
-            ),
-            wraplength=560,
-            text_color="#F44336",
-            font=ctk.CTkFont(size=13),
-        ).pack(expand=True, padx=20, pady=20)
-        root.mainloop()
+        from viewer.ui.library_viewer_ui import LibraryViewerUI
+    except ImportError as exc:
+        _show_error(
+            f"Missing dependency — cannot start GuidWire Library Viewer:\n{exc}",
+            "520x200",
+        )
         return
 
     app = LibraryViewerUI(engine)
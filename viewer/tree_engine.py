@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import sys
+from collections import deque
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    import json
+
+    _loads = json.loads
+
 
 def _assets_dir() -> Path:
     """Return the assets directory, whether running from source or a PyInstaller bundle."""
@@ -18,6 +28,21 @@ def _assets_dir() -> Path:
 _ASSETS_DIR = _assets_dir()
 
 
+@functools.lru_cache(maxsize=None)
+def _load_asset_json(path: Path) -> dict[str, Any]:
+    """Parse a bundled JSON asset once per process.
+
+    The assets ship inside the executable and never change while it runs;
+    the returned dict is shared, so treat it as read-only.
+    """
+    return _loads(path.read_bytes())
+
+
+def _intern(value: Any) -> Any:
+    """Intern *value* if it is a str; trees may also use int ids."""
+    return sys.intern(value) if type(value) is str else value
+
+
 class TreeEngine:
     """Loads and navigates a GuidWire decision tree.
 
@@ -51,19 +76,34 @@ class TreeEngine:
             if not config_path.exists():
                 raise FileNotFoundError(f"config.json not found at {config_path}")
 
-            with tree_path.open(encoding="utf-8") as f:
-                self._tree = json.load(f)
-
-            with config_path.open(encoding="utf-8") as f:
-                self._config = json.load(f)
+            self._tree = _load_asset_json(tree_path)
+            self._config = _load_asset_json(config_path)
 
-        # Index nodes by id for O(1) lookup
+        # Index nodes by id for O(1) lookup.  Ids are interned here and in
+        # the option maps so ids held by the engine share one object each
+        # (the node dicts are left untouched: LibraryEngine shares them).
         self._nodes: dict[str, dict[str, Any]] = {
-            node["id"]: node for node in self._tree.get("nodes", [])
+            _intern(node["id"]): node for node in self._tree.get("nodes", [])
         }
+        # Option label -> next node id for each question node, so navigate()
+        # is a dict lookup rather than a scan of the options.  Like that scan,
+        # the first option wins when a label is repeated.
+        self._option_maps: dict[str, dict[str, str]] = {}
+        # Every option label as an immutable tuple, in display order, for the UIs
+        self._option_labels: dict[str, tuple[str, ...]] = {}
+        for nid, node in self._nodes.items():
+            if node.get("type") != "question":
+                continue
+            options = node.get("options", [])
+            option_map: dict[str, str] = {}
+            for opt in options:
+                option_map.setdefault(opt["label"], _intern(opt["next"]))
+            self._option_maps[nid] = option_map
+            self._option_labels[nid] = tuple(opt["label"] for opt in options)
 
         self._current_id: str = "start"
-        self._history: list[str] = []
+        # Stack of visited node ids (append / pop / clear only)
+        self._history: deque[str] = deque()
 
     # ------------------------------------------------------------------
     # Public properties
@@ -89,6 +129,10 @@ class TreeEngine:
         """Return the current node dict."""
         return self._nodes[self._current_id]
 
+    def get_option_labels(self) -> tuple[str, ...]:
+        """Return the option labels of the current node; empty unless it is a question."""
+        return self._option_labels.get(self._current_id, ())
+
     def navigate(self, option_label: str) -> None:
         """For question nodes: advance to the node referenced by option_label.
 
@@ -99,21 +143,19 @@ class TreeEngine:
             ValueError: If the current node is not a question node or the label
                         is not found.
         """
-        node = self.get_current_node()
-        if node["type"] != "question":
+        options = self._option_maps.get(self._current_id)
+        if options is None:
             raise ValueError(
                 f"navigate() called on non-question node '{self._current_id}'"
             )
 
-        for option in node.get("options", []):
-            if option["label"] == option_label:
-                self._history.append(self._current_id)
-                self._current_id = option["next"]
-                return
-
-        raise ValueError(
-            f"Option '{option_label}' not found in node '{self._current_id}'"
-        )
+        next_id = options.get(option_label)
+        if next_id is None:
+            raise ValueError(
+                f"Option '{option_label}' not found in node '{self._current_id}'"
+            )
+        self._history.append(self._current_id)
+        self._current_id = next_id
 
     def advance(self) -> None:
         """For step nodes: advance to the next node.
@@ -135,9 +177,17 @@ class TreeEngine:
         self._history.clear()
 
     def get_history(self) -> list[str]:
-        """Return list of visited node texts for breadcrumb display."""
+        """Return list of visited node texts for breadcrumb display.
+
+        Builds a new list on every call; use :meth:`history_len` when only
+        the depth is needed.
+        """
         return [self._nodes[nid]["text"] for nid in self._history]
 
+    def history_len(self) -> int:
+        """Return how many nodes have been visited before the current one."""
+        return len(self._history)
+
     def is_complete(self) -> bool:
         """Return True if the current node is a resolution (terminal) node."""
         return self.get_current_node().get("type") == "resolution"
@@ -10,38 +10,69 @@ Provides:
 
 from __future__ import annotations
 
+import functools
 import threading
+from concurrent.futures import Future
 from pathlib import Path
 from tkinter import messagebox
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import customtkinter as ctk
-from PIL import Image
+
+if TYPE_CHECKING:
+    from PIL import Image
 
 # ---------------------------------------------------------------------------
-# Appearance defaults (match builder / single-doc viewer)
+# Assets
 # ---------------------------------------------------------------------------
-ctk.set_appearance_mode("dark")
-ctk.set_default_color_theme("dark-blue")
-
 _ASSETS_DIR = Path(__file__).parent.parent / "assets"
 
+# How often a pending tree load or search is checked; both are usually quick
+_LOAD_POLL_MS = 15
 
-def _load_logo() -> ctk.CTkImage | None:
+# Idle time after the last keystroke before the search runs
+_SEARCH_DEBOUNCE_MS = 150
+
+# Node type badge colours in the tree panel
+_BADGE_COLORS: dict[str, str] = {
+    "question": "#2196F3",
+    "step": "#FF9800",
+    "resolution": "#4CAF50",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _decode_logo() -> Image.Image | None:
+    """Decode and scale the bundled logo once per process.
+
+    The PIL image is what gets cached: a CTkImage holds Tk images that die
+    with the window that first displayed them.
+    """
     logo_path = _ASSETS_DIR / "logo.png"
     if not logo_path.exists():
         return None
     try:
+        from PIL import Image
+
         img = Image.open(str(logo_path)).convert("RGBA")
         w, h = img.size
         if h > 60:
             ratio = 60 / h
-            img = img.resize((int(w * ratio), 60), Image.LANCZOS)
-        return ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
+            # reducing_gap: box-reduce by an integer factor first, so the
+            # LANCZOS pass only runs over a few times the target pixels
+            img = img.resize((int(w * ratio), 60), Image.LANCZOS, reducing_gap=2.0)
+        return img
     except Exception:  # noqa: BLE001
         return None
 
 
+def _load_logo() -> ctk.CTkImage | None:
+    img = _decode_logo()
+    if img is None:
+        return None
+    return ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
+
+
 # ---------------------------------------------------------------------------
 # Library Viewer main window
 # ---------------------------------------------------------------------------
@@ -50,7 +81,15 @@ def _load_logo() -> ctk.CTkImage | None:
 class LibraryViewerUI(ctk.CTk):
     """Main window for the GuidWire offline library viewer."""
 
+    _appearance_configured = False  # See __init__
+
     def __init__(self, engine: "LibraryEngine") -> None:  # type: ignore[name-defined]  # noqa: F821
+        # The CTk theme is global; set it for the first window rather than
+        # at import time
+        if not LibraryViewerUI._appearance_configured:
+            ctk.set_appearance_mode("dark")
+            ctk.set_default_color_theme("dark-blue")
+            LibraryViewerUI._appearance_configured = True
         super().__init__()
 
         self._engine = engine
@@ -60,6 +99,28 @@ class LibraryViewerUI(ctk.CTk):
 
         # Tree navigation state (None when no tree is open)
         self._tree_engine: Any = None
+        self._tree_panel_built = False
+
+        # Entry list rows, reused across searches; see _show_entry_list
+        self._row_pool: list[
+            tuple[ctk.CTkFrame, ctk.CTkLabel, ctk.CTkLabel, ctk.CTkLabel]
+        ] = []
+        self._row_entries: list[dict[str, Any]] = []
+        self._visible_rows = 0
+        self._search_after_id: str | None = None
+        self._search_token = 0
+        self._cat_entries_cache: dict[str, list[dict[str, Any]]] = {}
+
+        # Shared fonts — each CTkFont is a Tk named font, so create them once
+        self._font_header = ctk.CTkFont(size=20, weight="bold")
+        self._font_title = ctk.CTkFont(size=15, weight="bold")
+        self._font_body = ctk.CTkFont(size=14)
+        self._font_action = ctk.CTkFont(size=13, weight="bold")
+        self._font_item = ctk.CTkFont(size=12)
+        self._font_item_bold = ctk.CTkFont(size=12, weight="bold")
+        self._font_small = ctk.CTkFont(size=11)
+        self._font_badge = ctk.CTkFont(size=11, weight="bold")
+        self._font_tiny = ctk.CTkFont(size=10)
 
         self.title("GuidWire Library Viewer")
         self.geometry("1100x720")
@@ -93,7 +154,7 @@ class LibraryViewerUI(ctk.CTk):
         ctk.CTkLabel(
             header,
             text="GuidWire Library",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=self._font_header,
         ).grid(row=0, column=1, padx=8, sticky="w")
 
         # Search bar
@@ -111,7 +172,7 @@ class LibraryViewerUI(ctk.CTk):
             header,
             text=f"{len(self._engine.entries)} trees",
             text_color="gray50",
-            font=ctk.CTkFont(size=11),
+            font=self._font_small,
         ).grid(row=0, column=3, padx=8)
 
         self._theme_btn = ctk.CTkButton(
@@ -126,7 +187,7 @@ class LibraryViewerUI(ctk.CTk):
         ctk.CTkLabel(
             self._cat_sidebar,
             text="Categories",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=self._font_action,
             anchor="w",
         ).pack(fill="x", padx=12, pady=(12, 6))
 
@@ -162,7 +223,7 @@ class LibraryViewerUI(ctk.CTk):
             self._tree_panel,
             text="Select a tree from the list to begin.",
             text_color="gray50",
-            font=ctk.CTkFont(size=14),
+            font=self._font_body,
         )
         self._tree_placeholder.grid(row=0, column=0, padx=20, pady=40)
 
@@ -173,7 +234,7 @@ class LibraryViewerUI(ctk.CTk):
     def _populate_categories(self) -> None:
         categories = self._engine.get_categories()
         for cat in categories:
-            count = len(self._engine.get_entries_for_category(cat))
+            count = len(self._entries_for(cat))
             btn = ctk.CTkButton(
                 self._cat_sidebar,
                 text=f"{cat}  ({count})",
@@ -181,12 +242,21 @@ class LibraryViewerUI(ctk.CTk):
                 fg_color="transparent",
                 hover_color=("gray80", "gray25"),
                 text_color=("gray10", "gray90"),
-                font=ctk.CTkFont(size=12),
+                font=self._font_item,
                 command=lambda c=cat: self._select_category(c),
             )
             btn.pack(fill="x", padx=6, pady=2)
             self._cat_buttons[cat] = btn
 
+    def _entries_for(self, category: str) -> list[dict[str, Any]]:
+        """Entries in *category*, fetched from the engine once per category."""
+        entries = self._cat_entries_cache.get(category)
+        if entries is None:
+            entries = self._cat_entries_cache[category] = (
+                self._engine.get_entries_for_category(category)
+            )
+        return entries
+
     def _select_category(self, category: str) -> None:
         # Highlight selected
         for c, btn in self._cat_buttons.items():
@@ -194,7 +264,7 @@ class LibraryViewerUI(ctk.CTk):
 
         self._active_category = category
         self._search_var.set("")  # clear search when browsing by category
-        entries = self._engine.get_entries_for_category(category)
+        entries = self._entries_for(category)
         self._show_entry_list(entries)
 
     # ------------------------------------------------------------------
@@ -202,13 +272,26 @@ class LibraryViewerUI(ctk.CTk):
     # ------------------------------------------------------------------
 
     def _on_search_change(self, *_: Any) -> None:
+        # Wait for a pause in typing so a word costs one search, not one
+        # per keystroke; clearing the box still takes effect immediately
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        if self._search_var.get().strip():
+            self._search_after_id = self.after(_SEARCH_DEBOUNCE_MS, self._do_search)
+        else:
+            self._do_search()
+
+    def _do_search(self) -> None:
+        self._search_after_id = None
+        # Any search still running is now stale, including when the box
+        # was just cleared
+        self._search_token += 1
         query = self._search_var.get().strip()
         if not query:
             # Revert to active category view
             if self._active_category:
-                self._show_entry_list(
-                    self._engine.get_entries_for_category(self._active_category)
-                )
+                self._show_entry_list(self._entries_for(self._active_category))
             else:
                 self._clear_entry_list()
             return
@@ -217,68 +300,84 @@ class LibraryViewerUI(ctk.CTk):
         for btn in self._cat_buttons.values():
             btn.configure(fg_color="transparent")
 
-        results = self._engine.search(query)
-        self._show_entry_list(results)
+        self._poll_search(self._engine.search_async(query), self._search_token)
+
+    def _poll_search(self, future: Future, token: int) -> None:
+        if not future.done():
+            self.after(_LOAD_POLL_MS, self._poll_search, future, token)
+            return
+        if token != self._search_token:
+            return  # superseded by a newer query
+        self._show_entry_list(future.result())
 
     # ------------------------------------------------------------------
     # Entry list
     # ------------------------------------------------------------------
 
     def _clear_entry_list(self) -> None:
-        for w in self._entry_list_frame.winfo_children():
-            if w is not self._entry_count_label:
-                w.destroy()
+        self._hide_rows_from(0)
         self._entry_count_label.configure(text="Select a category or search.")
 
     def _show_entry_list(self, entries: list[dict[str, Any]]) -> None:
-        for w in self._entry_list_frame.winfo_children():
-            if w is not self._entry_count_label:
-                w.destroy()
-
         self._entry_count_label.configure(
             text=f"{len(entries)} tree{'s' if len(entries) != 1 else ''} found"
         )
 
-        for entry in entries:
-            row = ctk.CTkFrame(self._entry_list_frame, corner_radius=8)
-            row.pack(fill="x", padx=4, pady=3)
-            row.grid_columnconfigure(0, weight=1)
-
-            title = entry.get("title", entry.get("source_doc", "Untitled"))
-            desc = entry.get("description", "")
-
-            ctk.CTkLabel(
-                row,
-                text=title[:60] + ("…" if len(title) > 60 else ""),
-                font=ctk.CTkFont(size=12, weight="bold"),
-                anchor="w",
-                wraplength=240,
-                justify="left",
-            ).pack(fill="x", padx=10, pady=(8, 2))
-
-            if desc:
-                ctk.CTkLabel(
-                    row,
-                    text=desc[:80] + ("…" if len(desc) > 80 else ""),
-                    font=ctk.CTkFont(size=10),
-                    text_color="gray60",
-                    anchor="w",
-                    wraplength=240,
-                    justify="left",
-                ).pack(fill="x", padx=10, pady=(0, 2))
-
-            ctk.CTkLabel(
-                row,
-                text=entry.get("category", ""),
-                font=ctk.CTkFont(size=10),
-                text_color="#64B5F6",
-                anchor="w",
-            ).pack(fill="x", padx=10, pady=(0, 6))
-
-            entry_ref = entry
-            row.bind("<Button-1>", lambda e, ref=entry_ref: self._open_tree(ref))
-            for child in row.winfo_children():
-                child.bind("<Button-1>", lambda e, ref=entry_ref: self._open_tree(ref))
+        # Rows are pooled: a search keystroke reconfigures existing rows
+        # instead of destroying and recreating every CTk widget.
+        self._row_entries = list(entries)
+        while len(self._row_pool) < len(entries):
+            self._row_pool.append(self._make_entry_row(len(self._row_pool)))
+        for idx, entry in enumerate(entries):
+            self._configure_entry_row(self._row_pool[idx], entry)
+            if idx >= self._visible_rows:
+                self._row_pool[idx][0].pack(fill="x", padx=4, pady=3)
+        self._hide_rows_from(len(entries))
+        self._visible_rows = len(entries)
+
+    def _hide_rows_from(self, start: int) -> None:
+        for row, *_ in self._row_pool[start:self._visible_rows]:
+            row.pack_forget()
+        self._visible_rows = min(self._visible_rows, start)
+
+    def _make_entry_row(
+        self, idx: int
+    ) -> tuple[ctk.CTkFrame, ctk.CTkLabel, ctk.CTkLabel, ctk.CTkLabel]:
+        row = ctk.CTkFrame(self._entry_list_frame, corner_radius=8)
+        row.grid_columnconfigure(0, weight=1)
+        title = ctk.CTkLabel(row, text="", font=self._font_item_bold, anchor="w",
+                             wraplength=240, justify="left")
+        title.pack(fill="x", padx=10, pady=(8, 2))
+        desc = ctk.CTkLabel(row, text="", font=self._font_tiny, text_color="gray60",
+                            anchor="w", wraplength=240, justify="left")
+        category = ctk.CTkLabel(row, text="", font=self._font_tiny,
+                                text_color="#64B5F6", anchor="w")
+        category.pack(fill="x", padx=10, pady=(0, 6))
+
+        # Bound once; the row's current entry is looked up at click time
+        def _on_click(_event: Any, i: int = idx) -> None:
+            self._open_tree(self._row_entries[i])
+
+        for widget in (row, title, desc, category):
+            widget.bind("<Button-1>", _on_click)
+        return row, title, desc, category
+
+    @staticmethod
+    def _configure_entry_row(
+        widgets: tuple[ctk.CTkFrame, ctk.CTkLabel, ctk.CTkLabel, ctk.CTkLabel],
+        entry: dict[str, Any],
+    ) -> None:
+        _row, title_label, desc_label, category_label = widgets
+        title = entry.get("title", entry.get("source_doc", "Untitled"))
+        desc = entry.get("description", "")
+        title_label.configure(text=title[:60] + ("…" if len(title) > 60 else ""))
+        if desc:
+            desc_label.configure(text=desc[:80] + ("…" if len(desc) > 80 else ""))
+            if not desc_label.winfo_manager():
+                desc_label.pack(fill="x", padx=10, pady=(0, 2), before=category_label)
+        elif desc_label.winfo_manager():
+            desc_label.pack_forget()
+        category_label.configure(text=entry.get("category", ""))
 
     # ------------------------------------------------------------------
     # Tree panel
@@ -286,8 +385,17 @@ class LibraryViewerUI(ctk.CTk):
 
     def _open_tree(self, entry: dict[str, Any]) -> None:
         self._active_entry = entry
+        self._poll_tree_load(self._engine.load_tree_async(entry), entry)
+
+    def _poll_tree_load(self, future: Future, entry: dict[str, Any]) -> None:
+        """Wait for *future* without blocking the Tk loop, then show the tree."""
+        if not future.done():
+            self.after(_LOAD_POLL_MS, self._poll_tree_load, future, entry)
+            return
+        if entry is not self._active_entry:
+            return  # another entry was clicked while this one loaded
         try:
-            tree_dict = self._engine.load_tree(entry)
+            tree_dict = future.result()
         except Exception as exc:  # noqa: BLE001
             messagebox.showerror("Load Error", str(exc))
             return
@@ -297,37 +405,22 @@ class LibraryViewerUI(ctk.CTk):
         self._tree_engine = TreeEngine(tree_dict=tree_dict, company_name="GuidWire")
         self._refresh_tree_panel()
 
-    def _refresh_tree_panel(self) -> None:
-        # Clear the panel
-        for w in self._tree_panel.winfo_children():
-            w.destroy()
-
-        if self._tree_engine is None or self._active_entry is None:
-            self._tree_placeholder = ctk.CTkLabel(
-                self._tree_panel,
-                text="Select a tree from the list to begin.",
-                text_color="gray50",
-                font=ctk.CTkFont(size=14),
-            )
-            self._tree_placeholder.grid(row=0, column=0, padx=20, pady=40)
-            return
-
-        engine = self._tree_engine
-        entry = self._active_entry
-        node = engine.get_current_node()
-        node_type = node.get("type", "question")
+    def _build_tree_panel(self) -> None:
+        """Create the tree panel's widgets; _refresh_tree_panel fills them in."""
+        self._tree_placeholder.destroy()
 
         # ---- Title bar ----
         title_bar = ctk.CTkFrame(self._tree_panel, fg_color="transparent")
         title_bar.grid(row=0, column=0, sticky="ew", padx=14, pady=(10, 4))
         title_bar.grid_columnconfigure(0, weight=1)
 
-        ctk.CTkLabel(
+        self._tp_title = ctk.CTkLabel(
             title_bar,
-            text=entry.get("title", "Tree"),
-            font=ctk.CTkFont(size=15, weight="bold"),
+            text="",
+            font=self._font_title,
             anchor="w",
-        ).grid(row=0, column=0, sticky="w")
+        )
+        self._tp_title.grid(row=0, column=0, sticky="w")
 
         # "Open Source Document" button
         ctk.CTkButton(
@@ -340,46 +433,40 @@ class LibraryViewerUI(ctk.CTk):
         ).grid(row=0, column=1, padx=(8, 0))
 
         # ---- Node type badge + text ----
-        badge_colors = {
-            "question": "#2196F3",
-            "step": "#FF9800",
-            "resolution": "#4CAF50",
-        }
         card = ctk.CTkFrame(self._tree_panel, corner_radius=12)
         card.grid(row=1, column=0, sticky="nsew", padx=14, pady=6)
         card.grid_columnconfigure(0, weight=1)
         card.grid_rowconfigure(1, weight=1)
         self._tree_panel.grid_rowconfigure(1, weight=1)
 
-        ctk.CTkLabel(
+        self._tp_badge = ctk.CTkLabel(
             card,
-            text=node_type.upper(),
+            text="",
             width=100,
             corner_radius=8,
-            font=ctk.CTkFont(size=11, weight="bold"),
-            fg_color=badge_colors.get(node_type, "gray50"),
+            font=self._font_badge,
             text_color="white",
-        ).grid(row=0, column=0, padx=16, pady=(12, 4), sticky="w")
+        )
+        self._tp_badge.grid(row=0, column=0, padx=16, pady=(12, 4), sticky="w")
 
-        ctk.CTkLabel(
+        self._tp_text = ctk.CTkLabel(
             card,
-            text=node.get("text", ""),
-            font=ctk.CTkFont(size=14),
+            text="",
+            font=self._font_body,
             wraplength=520,
             justify="left",
             anchor="nw",
-        ).grid(row=1, column=0, padx=16, pady=(4, 12), sticky="nsew")
+        )
+        self._tp_text.grid(row=1, column=0, padx=16, pady=(4, 12), sticky="nsew")
 
         # ---- Navigation options ----
-        nav_frame = ctk.CTkScrollableFrame(
+        self._tp_nav_frame = ctk.CTkScrollableFrame(
             self._tree_panel, height=160, fg_color="transparent"
         )
-        nav_frame.grid(row=2, column=0, sticky="ew", padx=14, pady=(0, 6))
-        nav_frame.grid_columnconfigure(0, weight=1)
+        self._tp_nav_frame.grid(row=2, column=0, sticky="ew", padx=14, pady=(0, 6))
+        self._tp_nav_frame.grid_columnconfigure(0, weight=1)
 
-        self._build_nav_buttons(nav_frame, node, node_type)
-
-        # ---- Footer (breadcrumb + back/reset) ----
+        # ---- Footer (step counter + back/reset) ----
         footer = ctk.CTkFrame(self._tree_panel, height=44, fg_color="transparent")
         footer.grid(row=3, column=0, sticky="ew", padx=14, pady=(0, 10))
         footer.grid_columnconfigure(1, weight=1)
@@ -392,14 +479,10 @@ class LibraryViewerUI(ctk.CTk):
             command=self._tree_go_back,
         ).grid(row=0, column=0, padx=(0, 6))
 
-        history = engine.get_history()
-        step_text = (
-            f"Step {engine.current_step_number()} "
-            f"of ~{engine.approximate_total_steps()}"
+        self._tp_step = ctk.CTkLabel(
+            footer, text="", text_color="gray60", font=self._font_small
         )
-        ctk.CTkLabel(
-            footer, text=step_text, text_color="gray60", font=ctk.CTkFont(size=11)
-        ).grid(row=0, column=1)
+        self._tp_step.grid(row=0, column=1)
 
         ctk.CTkButton(
             footer,
@@ -409,18 +492,46 @@ class LibraryViewerUI(ctk.CTk):
             command=self._tree_reset,
         ).grid(row=0, column=2, padx=(6, 0))
 
+        self._tree_panel_built = True
+
+    def _refresh_tree_panel(self) -> None:
+        if self._tree_engine is None or self._active_entry is None:
+            return
+        # The panel's frame is built once; each navigation step only
+        # reconfigures its labels and replaces the option buttons.
+        if not self._tree_panel_built:
+            self._build_tree_panel()
+
+        engine = self._tree_engine
+        node = engine.get_current_node()
+        node_type = node.get("type", "question")
+
+        self._tp_title.configure(text=self._active_entry.get("title", "Tree"))
+        self._tp_badge.configure(
+            text=node_type.upper(),
+            fg_color=_BADGE_COLORS.get(node_type, "gray50"),
+        )
+        self._tp_text.configure(text=node.get("text", ""))
+        self._tp_step.configure(
+            text=f"Step {engine.current_step_number()} "
+                 f"of ~{engine.approximate_total_steps()}"
+        )
+
+        for w in self._tp_nav_frame.winfo_children():
+            w.destroy()
+        self._build_nav_buttons(self._tp_nav_frame, node, node_type)
+
     def _build_nav_buttons(
         self, nav_frame: ctk.CTkScrollableFrame, node: dict[str, Any], node_type: str
     ) -> None:
         if node_type == "question":
-            for option in node.get("options", []):
-                label = option["label"]
+            for label in self._tree_engine.get_option_labels():
                 ctk.CTkButton(
                     nav_frame,
                     text=label,
                     anchor="w",
                     height=38,
-                    command=lambda lbl=label: self._tree_choose(lbl),
+                    command=functools.partial(self._tree_choose, label),
                 ).pack(fill="x", pady=2)
 
         elif node_type == "step":
@@ -428,7 +539,7 @@ class LibraryViewerUI(ctk.CTk):
                 nav_frame,
                 text="Next Step →",
                 height=42,
-                font=ctk.CTkFont(size=13, weight="bold"),
+                font=self._font_action,
                 command=self._tree_advance,
             ).pack(fill="x", pady=4)
 
@@ -438,13 +549,13 @@ class LibraryViewerUI(ctk.CTk):
             ctk.CTkLabel(
                 banner,
                 text="✓  Resolution",
-                font=ctk.CTkFont(size=12, weight="bold"),
+                font=self._font_item_bold,
                 text_color="#A5D6A7",
             ).pack(anchor="w", padx=14, pady=(8, 2))
             ctk.CTkLabel(
                 banner,
                 text=node.get("text", ""),
-                font=ctk.CTkFont(size=11),
+                font=self._font_small,
                 text_color="#C8E6C9",
                 wraplength=480,
                 justify="left",
@@ -489,9 +600,14 @@ class LibraryViewerUI(ctk.CTk):
     def _open_source_doc(self) -> None:
         if not self._active_entry:
             return
-        try:
-            self._engine.open_source_doc(self._active_entry)
-        except Exception as exc:  # noqa: BLE001
+        self._poll_doc_open(self._engine.open_source_doc_async(self._active_entry))
+
+    def _poll_doc_open(self, future: Future) -> None:
+        if not future.done():
+            self.after(_LOAD_POLL_MS, self._poll_doc_open, future)
+            return
+        exc = future.exception()
+        if exc is not None:
             messagebox.showerror("Cannot Open Document", str(exc))
 
     # ------------------------------------------------------------------
@@ -499,11 +615,10 @@ class LibraryViewerUI(ctk.CTk):
     # ------------------------------------------------------------------
 
     def _toggle_theme(self) -> None:
-        if self._dark_mode:
-            ctk.set_appearance_mode("light")
-            self._theme_btn.configure(text="🌙 Dark Mode")
-            self._dark_mode = False
-        else:
-            ctk.set_appearance_mode("dark")
-            self._theme_btn.configure(text="☀ Light Mode")
-            self._dark_mode = True
+        # Relabel the button before switching modes so the appearance change
+        # repaints every widget in one pass; nothing else needs refreshing.
+        self._dark_mode = not self._dark_mode
+        self._theme_btn.configure(
+            text="☀ Light Mode" if self._dark_mode else "🌙 Dark Mode"
+        )
+        ctk.set_appearance_mode("dark" if self._dark_mode else "light")
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 import sys
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import customtkinter as ctk
-from PIL import Image
+
+if TYPE_CHECKING:
+    from PIL import Image
 
 
 # ---------------------------------------------------------------------------
@@ -21,30 +24,63 @@ except Exception:
 
 
 # ---------------------------------------------------------------------------
-# Appearance defaults
+# Assets
 # ---------------------------------------------------------------------------
-ctk.set_appearance_mode("dark")
-ctk.set_default_color_theme("dark-blue")
-
 _ASSETS_DIR = Path(__file__).parent.parent / "assets"
 
+# Node type badge colours
+_BADGE_COLORS: dict[str, str] = {
+    "question": "#2196F3",
+    "step": "#FF9800",
+    "resolution": "#4CAF50",
+}
 
-def _load_logo() -> ctk.CTkImage | None:
+# Breadcrumb bar: (light, dark) background, crumb baseline and spacing in px
+_BREADCRUMB_BG = ("gray85", "gray20")
+_CRUMB_Y = 15
+_CRUMB_GAP = 6
+_CRUMB_SEP = "  ›"
+
+
+@functools.lru_cache(maxsize=1024)
+def _truncate(text: str) -> str:
+    """Shorten *text* to a 30-character breadcrumb crumb."""
+    return text[:30] + "…" if len(text) > 30 else text
+
+
+@functools.lru_cache(maxsize=1)
+def _decode_logo() -> Image.Image | None:
+    """Decode and scale the bundled logo once per process.
+
+    The PIL image is what gets cached: a CTkImage holds Tk images that die
+    with the window that first displayed them.
+    """
     logo_path = _ASSETS_DIR / "logo.png"
     if not logo_path.exists():
         return None
     try:
+        from PIL import Image
+
         img = Image.open(str(logo_path)).convert("RGBA")
         # Constrain height to 60px while preserving aspect ratio
         w, h = img.size
         if h > 60:
             ratio = 60 / h
-            img = img.resize((int(w * ratio), 60), Image.LANCZOS)
-        return ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
+            # reducing_gap: box-reduce by an integer factor first, so the
+            # LANCZOS pass only runs over a few times the target pixels
+            img = img.resize((int(w * ratio), 60), Image.LANCZOS, reducing_gap=2.0)
+        return img
     except Exception:
         return None
 
 
+def _load_logo() -> ctk.CTkImage | None:
+    img = _decode_logo()
+    if img is None:
+        return None
+    return ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
+
+
 # ---------------------------------------------------------------------------
 # Main Viewer UI
 # ---------------------------------------------------------------------------
@@ -53,12 +89,51 @@ def _load_logo() -> ctk.CTkImage | None:
 class ViewerUI(ctk.CTk):
     """Main window for the GuidWire Viewer application."""
 
+    _appearance_configured = False  # See __init__
+
     def __init__(self, engine: "TreeEngine") -> None:
+        # The CTk theme is global; set it for the first window rather than
+        # at import time
+        if not ViewerUI._appearance_configured:
+            ctk.set_appearance_mode("dark")
+            ctk.set_default_color_theme("dark-blue")
+            ViewerUI._appearance_configured = True
         super().__init__()
 
         self._engine = engine
         self._dark_mode = True
 
+        # Shared fonts — each CTkFont is a Tk named font, so create them once
+        self._font_header = ctk.CTkFont(size=20, weight="bold")
+        self._font_node = ctk.CTkFont(size=16)
+        self._font_button = ctk.CTkFont(size=14, weight="bold")
+        self._font_action = ctk.CTkFont(size=13, weight="bold")
+        self._font_item = ctk.CTkFont(size=12)
+        self._font_badge = ctk.CTkFont(size=11, weight="bold")
+        self._font_tiny = ctk.CTkFont(size=10)
+
+        # Breadcrumb canvas items and navigation widgets, reused across
+        # refreshes.  _breadcrumb_x[i] is the left edge of crumb i.
+        self._breadcrumb_items: list[int] = []  # Canvas text item ids
+        self._breadcrumb_texts: list[str | None] = []  # Drawn text per slot
+        self._breadcrumb_x: list[int] = [_CRUMB_GAP]
+        self._breadcrumb_visible = 0
+        self._option_pool: list[ctk.CTkButton] = []
+        self._option_labels: tuple[str, ...] = ()
+        self._next_btn: ctk.CTkButton | None = None
+        self._resolution_widgets: (
+            tuple[ctk.CTkFrame, ctk.CTkLabel, ctk.CTkButton] | None
+        ) = None
+        self._nav_shown: list[Any] = []
+        # Options last applied by _configure_if_changed, per widget
+        self._applied_options: dict[Any, dict[str, Any]] = {}
+        self._refresh_pending = False  # See _schedule_refresh
+        self._nav_builders = {
+            "question": self._show_question_nav,
+            "step": self._show_step_nav,
+            "resolution": self._show_resolution_nav,
+        }
+
         self.title(f"{engine.company_name} — GuidWire")
         self.geometry("800x600")
         self.resizable(True, True)
@@ -88,7 +163,7 @@ class ViewerUI(ctk.CTk):
         self._company_label = ctk.CTkLabel(
             header,
             text=self._engine.company_name,
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=self._font_header,
         )
         self._company_label.grid(row=0, column=1, padx=10, sticky="w")
 
@@ -99,16 +174,20 @@ class ViewerUI(ctk.CTk):
 
         # ---- BREADCRUMB BAR ----
         breadcrumb_outer = ctk.CTkFrame(self, height=36, corner_radius=0,
-                                        fg_color=("gray85", "gray20"))
+                                        fg_color=_BREADCRUMB_BG)
         breadcrumb_outer.grid(row=1, column=0, sticky="ew")
         breadcrumb_outer.grid_columnconfigure(0, weight=1)
         breadcrumb_outer.grid_propagate(False)
 
-        self._breadcrumb_scroll = ctk.CTkScrollableFrame(
-            breadcrumb_outer, height=30, orientation="horizontal",
-            fg_color="transparent",
+        # A bare canvas of text items rather than a CTkScrollableFrame of
+        # labels: one widget, scrolled with the mouse wheel.
+        self._breadcrumb_canvas = ctk.CTkCanvas(
+            breadcrumb_outer, height=30, highlightthickness=0,
+            bg=_BREADCRUMB_BG[1], xscrollincrement=20,
         )
-        self._breadcrumb_scroll.grid(row=0, column=0, sticky="ew", padx=4)
+        self._breadcrumb_canvas.grid(row=0, column=0, sticky="ew", padx=4, pady=3)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self._breadcrumb_canvas.bind(sequence, self._scroll_breadcrumb)
 
         # ---- MAIN CARD AREA ----
         card_outer = ctk.CTkFrame(self, fg_color="transparent")
@@ -124,7 +203,7 @@ class ViewerUI(ctk.CTk):
         # Node type badge
         self._type_badge = ctk.CTkLabel(
             self._main_card, text="QUESTION", width=100, corner_radius=8,
-            font=ctk.CTkFont(size=11, weight="bold"), fg_color="#2196F3",
+            font=self._font_badge, fg_color="#2196F3",
             text_color="white",
         )
         self._type_badge.grid(row=0, column=0, padx=20, pady=(16, 4), sticky="w")
@@ -132,7 +211,7 @@ class ViewerUI(ctk.CTk):
         # Node text
         self._node_text = ctk.CTkLabel(
             self._main_card, text="",
-            font=ctk.CTkFont(size=16),
+            font=self._font_node,
             wraplength=650, justify="left", anchor="nw",
         )
         self._node_text.grid(row=1, column=0, padx=20, pady=(8, 16), sticky="nsew")
@@ -170,18 +249,14 @@ class ViewerUI(ctk.CTk):
         node_text: str = node.get("text", "")
 
         # Update badge
-        badge_colors = {
-            "question": "#2196F3",
-            "step": "#FF9800",
-            "resolution": "#4CAF50",
-        }
-        self._type_badge.configure(
+        self._configure_if_changed(
+            self._type_badge,
             text=node_type.upper(),
-            fg_color=badge_colors.get(node_type, "gray50"),
+            fg_color=_BADGE_COLORS.get(node_type, "gray50"),
         )
 
         # Update node text
-        self._node_text.configure(text=node_text)
+        self._configure_if_changed(self._node_text, text=node_text)
 
         # Update breadcrumb
         self._update_breadcrumb()
@@ -190,106 +265,176 @@ class ViewerUI(ctk.CTk):
         self._update_nav(node)
 
         # Update step counter
-        self._step_counter.configure(
+        self._configure_if_changed(
+            self._step_counter,
             text=f"Step {self._engine.current_step_number()} "
-                 f"of ~{self._engine.approximate_total_steps()}"
+                 f"of ~{self._engine.approximate_total_steps()}",
         )
 
         # Back button enabled only if there is history
-        self._back_btn.configure(
-            state="normal" if self._engine.get_history() else "disabled"
+        self._configure_if_changed(
+            self._back_btn,
+            state="normal" if self._engine.history_len() else "disabled",
         )
 
-    def _update_breadcrumb(self) -> None:
-        for w in self._breadcrumb_scroll.winfo_children():
-            w.destroy()
+    def _configure_if_changed(self, widget: Any, **options: Any) -> None:
+        """``widget.configure(**options)`` unless those are already applied.
+
+        A CTk configure() redraws the widget even when nothing changed.
+        """
+        if self._applied_options.get(widget) != options:
+            widget.configure(**options)
+            self._applied_options[widget] = options
 
+    def _update_breadcrumb(self) -> None:
+        # Each crumb is one pooled canvas text item carrying its own trailing
+        # separator.  History only grows or shrinks at the end, so a step
+        # re-measures just the slots from the first changed one on.
         history = self._engine.get_history()
-        for i, text in enumerate(history):
-            short = text[:30] + ("…" if len(text) > 30 else "")
-            ctk.CTkLabel(
-                self._breadcrumb_scroll,
-                text=short,
-                font=ctk.CTkFont(size=10),
-                text_color="gray60",
-            ).pack(side="left", padx=2)
-            if i < len(history) - 1:
-                ctk.CTkLabel(self._breadcrumb_scroll, text="›",
-                             text_color="gray50",
-                             font=ctk.CTkFont(size=10)).pack(side="left")
+        last = len(history) - 1
+        crumbs = [
+            _truncate(text) + (_CRUMB_SEP if i < last else "")
+            for i, text in enumerate(history)
+        ]
+        canvas = self._breadcrumb_canvas
+        items = self._breadcrumb_items
+        while len(items) < len(crumbs):
+            items.append(canvas.create_text(0, _CRUMB_Y, anchor="w", fill="gray60",
+                                            font=self._font_tiny, state="hidden"))
+            self._breadcrumb_texts.append(None)
+
+        first = next(
+            (i for i, crumb in enumerate(crumbs) if self._breadcrumb_texts[i] != crumb),
+            len(crumbs),
+        )
+        xs = self._breadcrumb_x
+        del xs[first + 1:]
+        for i in range(first, len(crumbs)):
+            canvas.itemconfigure(items[i], text=crumbs[i], state="normal")
+            canvas.coords(items[i], xs[i], _CRUMB_Y)
+            xs.append(xs[i] + self._font_tiny.measure(crumbs[i]) + _CRUMB_GAP)
+            self._breadcrumb_texts[i] = crumbs[i]
+        for i in range(len(crumbs), self._breadcrumb_visible):
+            canvas.itemconfigure(items[i], state="hidden")
+            self._breadcrumb_texts[i] = None
+        self._breadcrumb_visible = len(crumbs)
+
+        canvas.configure(scrollregion=(0, 0, xs[-1], 0))
+        canvas.xview_moveto(1.0)
+
+    def _scroll_breadcrumb(self, event: Any) -> None:
+        up = event.num == 4 or getattr(event, "delta", 0) > 0
+        self._breadcrumb_canvas.xview_scroll(-1 if up else 1, "units")
 
     def _update_nav(self, node: dict[str, Any]) -> None:
-        for w in self._nav_frame.winfo_children():
-            w.destroy()
-
-        node_type = node.get("type", "question")
-
-        if node_type == "question":
-            for option in node.get("options", []):
-                label = option["label"]
-                btn = ctk.CTkButton(
-                    self._nav_frame,
-                    text=label,
-                    anchor="w",
-                    height=40,
-                    command=lambda lbl=label: self._choose_option(lbl),
-                )
-                btn.pack(fill="x", pady=3)
-
-        elif node_type == "step":
-            ctk.CTkButton(
+        # The navigation widgets are created on first use and then reused;
+        # each refresh only re-packs and reconfigures them.
+        for widget in self._nav_shown:
+            widget.pack_forget()
+        self._nav_shown = []
+
+        show = self._nav_builders.get(node.get("type", "question"))
+        if show is not None:
+            show(node)
+
+    def _show_question_nav(self, node: dict[str, Any]) -> None:
+        self._option_labels = self._engine.get_option_labels()
+        while len(self._option_pool) < len(self._option_labels):
+            idx = len(self._option_pool)
+            self._option_pool.append(ctk.CTkButton(
+                self._nav_frame,
+                text="",
+                anchor="w",
+                height=40,
+                command=lambda i=idx: self._choose_option(self._option_labels[i]),
+            ))
+        for label, btn in zip(self._option_labels, self._option_pool):
+            btn.configure(text=label)
+            btn.pack(fill="x", pady=3)
+            self._nav_shown.append(btn)
+
+    def _show_step_nav(self, node: dict[str, Any]) -> None:
+        if self._next_btn is None:
+            self._next_btn = ctk.CTkButton(
                 self._nav_frame,
                 text="Next Step →",
                 height=44,
-                font=ctk.CTkFont(size=14, weight="bold"),
+                font=self._font_button,
                 command=self._advance,
-            ).pack(fill="x", pady=6)
+            )
+        self._next_btn.pack(fill="x", pady=6)
+        self._nav_shown.append(self._next_btn)
 
-        elif node_type == "resolution":
+    def _show_resolution_nav(self, node: dict[str, Any]) -> None:
+        if self._resolution_widgets is None:
             banner = ctk.CTkFrame(self._nav_frame, fg_color="#1B5E20", corner_radius=10)
-            banner.pack(fill="x", pady=4)
             ctk.CTkLabel(
                 banner,
                 text="✓  Resolution",
-                font=ctk.CTkFont(size=13, weight="bold"),
+                font=self._font_action,
                 text_color="#A5D6A7",
             ).pack(anchor="w", padx=16, pady=(10, 2))
-            ctk.CTkLabel(
+            body = ctk.CTkLabel(
                 banner,
-                text=node.get("text", ""),
-                font=ctk.CTkFont(size=12),
+                text="",
+                font=self._font_item,
                 text_color="#C8E6C9",
                 wraplength=660,
                 justify="left",
                 anchor="w",
-            ).pack(anchor="w", padx=16, pady=(0, 10))
-
-            ctk.CTkButton(
+            )
+            body.pack(anchor="w", padx=16, pady=(0, 10))
+            start_over = ctk.CTkButton(
                 self._nav_frame,
                 text="Start Over",
                 fg_color="#4CAF50",
                 hover_color="#388E3C",
                 command=self._reset,
-            ).pack(pady=6)
+            )
+            self._resolution_widgets = (banner, body, start_over)
+        banner, body, start_over = self._resolution_widgets
+        body.configure(text=node.get("text", ""))
+        banner.pack(fill="x", pady=4)
+        start_over.pack(pady=6)
+        self._nav_shown += [banner, start_over]
 
     # ------------------------------------------------------------------
     # Navigation actions
     # ------------------------------------------------------------------
 
+    # Each action updates the engine and returns straight away; the widgets
+    # catch up in one refresh once Tk is idle (after repainting the pressed
+    # button), however many clicks arrived in between.  Option and Next
+    # clicks that land before that refresh came from buttons showing the
+    # previous node, so they are ignored.
+
     def _choose_option(self, label: str) -> None:
+        if self._refresh_pending:
+            return
         self._engine.navigate(label)
-        self._refresh()
+        self._schedule_refresh()
 
     def _advance(self) -> None:
+        if self._refresh_pending:
+            return
         self._engine.advance()
-        self._refresh()
+        self._schedule_refresh()
 
     def _go_back(self) -> None:
         self._engine.go_back()
-        self._refresh()
+        self._schedule_refresh()
 
     def _reset(self) -> None:
         self._engine.reset()
+        self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.after_idle(self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        self._refresh_pending = False
         self._refresh()
 
     # ------------------------------------------------------------------
@@ -297,11 +442,12 @@ class ViewerUI(ctk.CTk):
     # ------------------------------------------------------------------
 
     def _toggle_theme(self) -> None:
-        if self._dark_mode:
-            ctk.set_appearance_mode("light")
-            self._theme_btn.configure(text="🌙 Dark Mode")
-            self._dark_mode = False
-        else:
-            ctk.set_appearance_mode("dark")
-            self._theme_btn.configure(text="☀ Light Mode")
-            self._dark_mode = True
+        # Relabel the button before switching modes so the appearance change
+        # repaints every widget in one pass; nothing else needs refreshing.
+        self._dark_mode = not self._dark_mode
+        self._theme_btn.configure(
+            text="☀ Light Mode" if self._dark_mode else "🌙 Dark Mode"
+        )
+        ctk.set_appearance_mode("dark" if self._dark_mode else "light")
+        # The breadcrumb canvas is plain Tk, so CTk does not re-tint it
+        self._breadcrumb_canvas.configure(bg=_BREADCRUMB_BG[self._dark_mode])